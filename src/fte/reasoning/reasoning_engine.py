@@ -9,6 +9,9 @@ import json
 from ..vault_manager import VaultManager
 from .plan_parser import PlanParser
 
+# Reasoning traces kept per engine; long-lived engines drop the oldest beyond this
+_REASONING_HISTORY_LIMIT = 100
+
 
 class ReasoningEngine:
     """Iterative reasoning engine that processes Plan.md files."""
@@ -70,6 +73,8 @@ class ReasoningEngine:
 
         # Store in reasoning history
         self.reasoning_history.append(reasoning_trace)
+        if len(self.reasoning_history) > _REASONING_HISTORY_LIMIT:
+            del self.reasoning_history[:-_REASONING_HISTORY_LIMIT]
 
         return reasoning_trace
 
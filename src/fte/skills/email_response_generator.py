@@ -1,14 +1,9 @@
 """Email Response Generator Skill - Generate AI-powered email responses."""
 
-import sys
 from pathlib import Path
 from typing import Dict, Any
 
-# Add the src directory to the Python path
-src_path = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(src_path))
-
-from fte.vault_manager import VaultManager
+from ..vault_manager import VaultManager
 
 
 def generate_email_response(email_file_path: str, custom_instructions: str = "") -> Dict[str, Any]:
@@ -150,12 +145,20 @@ def append_response_to_email(original_content: str, response: str) -> str:
     return original_content + response
 
 
-def process_inbox_for_responses(vault_path: str | Path | None = None) -> Dict[str, Any]:
-    """Process all emails in the Inbox and generate AI responses for them."""
-    manager = VaultManager(vault_path)
+def process_inbox_for_responses(
+    vault_path: str | Path | None = None,
+    inbox_files: list[Path] | None = None,
+) -> Dict[str, Any]:
+    """Process all emails in the Inbox and generate AI responses for them.
 
-    # Get all email files in Inbox
-    inbox_files = manager.list_files("Inbox")
+    Args:
+        vault_path: Optional path to vault directory
+        inbox_files: Inbox files already listed by the caller, to skip a rescan
+    """
+    if inbox_files is None:
+        # Get all email files in Inbox
+        manager = VaultManager(vault_path)
+        inbox_files = manager.list_files("Inbox")
 
     results = {
         "processed": 0,
@@ -6,13 +6,30 @@ import asyncio
 import importlib
 import inspect
 import json
+import logging
+import string
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from array import array
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Callable, Type, Union
-from ..vault_manager import VaultManager
+from ..vault_manager import get_vault_manager
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Per-skill loggers, shared by every instance of a skill with the same name
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
 
 
 class SkillStatus(Enum):
@@ -32,7 +49,7 @@ class SkillPriority(Enum):
     CRITICAL = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillDependency:
     """Represents a dependency between skills."""
     name: str
@@ -41,7 +58,7 @@ class SkillDependency:
     condition: Optional[str] = None  # Condition for dependency to apply
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillMetadata:
     """Metadata about a skill."""
     name: str
@@ -54,6 +71,15 @@ class SkillMetadata:
     enabled: bool
     last_updated: datetime
     execution_stats: Dict[str, Any]
+    _iso_cache: Optional[tuple] = field(init=False, default=None, repr=False, compare=False)
+
+    @property
+    def last_updated_iso(self) -> str:
+        """last_updated as an ISO string, formatted once per timestamp."""
+        cached = self._iso_cache
+        if cached is None or cached[0] is not self.last_updated:
+            cached = self._iso_cache = (self.last_updated, self.last_updated.isoformat())
+        return cached[1]
 
 
 class BaseSkill(ABC):
@@ -67,7 +93,7 @@ class BaseSkill(ABC):
             vault_path: Path to vault for storage
         """
         self.name = name
-        self.vault_manager = VaultManager(vault_path)
+        self.vault_manager = get_vault_manager(vault_path)
         self.status = SkillStatus.LOADED
         self.metadata = self._create_metadata()
         self.dependencies = []
@@ -106,16 +132,12 @@ class BaseSkill(ABC):
             }
         )
 
-    def _setup_logger(self):
+    def _setup_logger(self) -> logging.Logger:
         """Setup logging for the skill."""
-        # This would normally create a logger specific to the skill
-        # For now, returning a mock logger
-        class MockLogger:
-            def info(self, msg): print(f"[INFO] {self.__class__.__name__}: {msg}")
-            def error(self, msg): print(f"[ERROR] {self.__class__.__name__}: {msg}")
-            def debug(self, msg): print(f"[DEBUG] {self.__class__.__name__}: {msg}")
-
-        return MockLogger()
+        skill_logger = _LOGGER_CACHE.get(self.name)
+        if skill_logger is None:
+            skill_logger = _LOGGER_CACHE.setdefault(self.name, logging.getLogger(f"fte.skill.{self.name}"))
+        return skill_logger
 
     def add_dependency(self, dependency: SkillDependency):
         """Add a dependency to this skill."""
@@ -131,10 +153,11 @@ class BaseSkill(ABC):
             await self._on_activate()
             self.status = SkillStatus.ACTIVE
             self.metadata.enabled = True
-            self.logger.info(f"Skill {self.name} activated")
-        except Exception as e:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Skill %s activated", self.name)
+        except Exception:
             self.status = SkillStatus.ERROR
-            self.logger.error(f"Error activating skill {self.name}: {e}")
+            self.logger.exception("Error activating skill %s", self.name)
 
     async def deactivate(self):
         """Deactivate the skill."""
@@ -142,10 +165,11 @@ class BaseSkill(ABC):
             await self._on_deactivate()
             self.status = SkillStatus.INACTIVE
             self.metadata.enabled = False
-            self.logger.info(f"Skill {self.name} deactivated")
-        except Exception as e:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Skill %s deactivated", self.name)
+        except Exception:
             self.status = SkillStatus.ERROR
-            self.logger.error(f"Error deactivating skill {self.name}: {e}")
+            self.logger.exception("Error deactivating skill %s", self.name)
 
     async def _on_activate(self):
         """Hook called when skill is activated."""
@@ -157,28 +181,63 @@ class BaseSkill(ABC):
 
     async def execute_with_tracking(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the skill with execution tracking."""
-        start_time = datetime.now()
-        self.metadata.execution_stats["total_executions"] += 1
+        stats = self.metadata.execution_stats
+        start_time = time.perf_counter()
+        stats["total_executions"] += 1
 
         try:
             result = await self.execute(params)
-            self.metadata.execution_stats["success_count"] += 1
 
-            # Update execution time stats
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self.metadata.execution_stats["avg_execution_time"] = (
-                self.metadata.execution_stats["avg_execution_time"] *
-                (self.metadata.execution_stats["success_count"] - 1) +
-                execution_time
-            ) / self.metadata.execution_stats["success_count"]
+            # Update execution time stats with an incremental mean
+            execution_time = time.perf_counter() - start_time
+            success_count = stats["success_count"] = stats["success_count"] + 1
+            stats["avg_execution_time"] += (execution_time - stats["avg_execution_time"]) / success_count
 
             return result
-        except Exception as e:
-            self.metadata.execution_stats["failure_count"] += 1
-            self.logger.error(f"Skill {self.name} execution failed: {e}")
+        except Exception:
+            stats["failure_count"] += 1
+            self.logger.exception("Skill %s execution failed", self.name)
             raise
 
 
+@lru_cache(maxsize=256)
+def _resolve_skill_class(module_path: str, class_name: str, skill_name: str) -> Optional[Type[BaseSkill]]:
+    """Import and return a skill class, or None if no implementation exists.
+
+    Results are cached so repeated instantiation of the same skill skips the
+    import and fallback lookups.
+    """
+    try:
+        module = importlib.import_module(module_path)
+        return getattr(module, class_name)
+    except (ImportError, AttributeError):
+        pass
+
+    # Try alternative naming convention
+    try:
+        module = importlib.import_module(f"src.fte.skills.{skill_name}")
+        return getattr(module, class_name)
+    except (ImportError, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def _make_generic_skill_class(skill_name: str) -> Type[BaseSkill]:
+    """Create a generic skill class for a skill name, once per name."""
+    class GenericSkill(BaseSkill):
+        async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+            # For generic skills, we return an error indicating
+            # that the skill needs to be implemented
+            return {
+                "status": "error",
+                "message": f"Skill {self.name} not implemented",
+                "params": params
+            }
+
+    GenericSkill.__name__ = f"{skill_name.capitalize()}Skill"
+    return GenericSkill
+
+
 class SkillRegistry:
     """Centralized registry for managing skills."""
 
@@ -190,9 +249,20 @@ class SkillRegistry:
         """
         self.skills: Dict[str, BaseSkill] = {}
         self.skill_configs: Dict[str, Dict[str, Any]] = {}
-        self.vault_manager = VaultManager(vault_path)
+        self.vault_manager = get_vault_manager(vault_path)
         self.dependency_graph = {}
         self.execution_order = []
+        self._graph_version = 0
+        self._graph_cache = None
+        self._id_to_name: List[str] = []
+        self._name_to_id: Dict[str, int] = {}
+        self._graph_indptr = array("i", [0])
+        self._graph_indices = array("i")
+        self._graph_in_degree = array("i")
+
+    def bump_version(self):
+        """Invalidate the cached dependency graph and execution order."""
+        self._graph_version += 1
 
     def register_skill(self, skill_class: Type[BaseSkill], config: Optional[Dict[str, Any]] = None):
         """Register a skill class in the registry.
@@ -202,12 +272,13 @@ class SkillRegistry:
             config: Configuration for the skill instance
         """
         config = config or {}
-        skill_name = config.get("name", skill_class.__name__.lower().replace("skill", ""))
+        skill_name = config.get("name") or skill_class.__name__.lower().replace("skill", "")
 
         # Store the configuration
         self.skill_configs[skill_name] = config
+        self.bump_version()
 
-        self.logger.info(f"Registered skill class: {skill_name}")
+        logger.info("Registered skill class: %s", skill_name)
 
     def instantiate_skill(self, skill_name: str, vault_path: Optional[Path] = None) -> BaseSkill:
         """Instantiate a skill by name.
@@ -228,17 +299,10 @@ class SkillRegistry:
         module_path = config.get("module_path", f"src.fte.skills.{skill_name}_skill")
         class_name = config.get("class_name", f"{skill_name.capitalize()}Skill")
 
-        try:
-            module = importlib.import_module(module_path)
-            skill_class = getattr(module, class_name)
-        except (ImportError, AttributeError):
-            # Try alternative naming convention
-            try:
-                module = importlib.import_module(f"src.fte.skills.{skill_name}")
-                skill_class = getattr(module, class_name)
-            except (ImportError, AttributeError):
-                # Create a generic skill if specific one doesn't exist
-                skill_class = self._create_generic_skill_class(skill_name)
+        skill_class = _resolve_skill_class(module_path, class_name, skill_name)
+        if skill_class is None:
+            # Create a generic skill if specific one doesn't exist
+            skill_class = self._create_generic_skill_class(skill_name)
 
         # Instantiate the skill
         skill_instance = skill_class(skill_name, vault_path)
@@ -251,22 +315,12 @@ class SkillRegistry:
             for dep_name in config["dependencies"]:
                 skill_instance.add_dependency(SkillDependency(dep_name, "1.0.0"))
 
+        self.bump_version()
         return skill_instance
 
     def _create_generic_skill_class(self, skill_name: str) -> Type[BaseSkill]:
         """Create a generic skill class for a skill name."""
-        class GenericSkill(BaseSkill):
-            async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
-                # For generic skills, we return an error indicating
-                # that the skill needs to be implemented
-                return {
-                    "status": "error",
-                    "message": f"Skill {self.name} not implemented",
-                    "params": params
-                }
-
-        GenericSkill.__name__ = f"{skill_name.capitalize()}Skill"
-        return GenericSkill
+        return _make_generic_skill_class(skill_name)
 
     async def load_skill(self, skill_name: str, vault_path: Optional[Path] = None) -> BaseSkill:
         """Load a skill by name.
@@ -298,9 +352,14 @@ class SkillRegistry:
         if skill_name not in self.skills:
             return False
 
-        skill = self.skills[skill_name]
+        skill = self.skills.pop(skill_name)
         await skill.deactivate()
-        del self.skills[skill_name]
+
+        # Remaining skills should no longer list the unloaded one as a dependent
+        for other in self.skills.values():
+            if skill_name in other.dependents:
+                other.dependents[:] = [name for name in other.dependents if name != skill_name]
+        self.bump_version()
 
         return True
 
@@ -357,37 +416,119 @@ class SkillRegistry:
         return await skill.execute_with_tracking(params)
 
     def build_dependency_graph(self):
-        """Build the dependency graph for all skills."""
+        """Build the dependency graph for all skills.
+
+        Besides the name-keyed ``dependency_graph``, skill names are interned
+        to integer ids and the dependent edges are stored in CSR form
+        (``_graph_indptr``/``_graph_indices``) for the topological sort.
+        """
         self.dependency_graph = {}
+        self._id_to_name = list(self.skills)
+        self._name_to_id = {name: idx for idx, name in enumerate(self._id_to_name)}
+
+        node_count = len(self._id_to_name)
+        in_degree = array("i", [0]) * node_count
+        dependents: List[List[int]] = [[] for _ in range(node_count)]
 
         for skill_name, skill in self.skills.items():
             deps = [dep.name for dep in skill.dependencies]
             self.dependency_graph[skill_name] = deps
 
+            skill_id = self._name_to_id[skill_name]
+            for dep_name in deps:
+                dep_id = self._name_to_id.get(dep_name)
+                if dep_id is not None:
+                    dependents[dep_id].append(skill_id)
+                    in_degree[skill_id] += 1
+
+        indptr = array("i", [0])
+        indices = array("i")
+        for targets in dependents:
+            indices.extend(targets)
+            indptr.append(len(indices))
+
+        self._graph_indptr = indptr
+        self._graph_indices = indices
+        self._graph_in_degree = in_degree
+
     def calculate_execution_order(self):
         """Calculate the proper execution order based on dependencies."""
-        # Topological sort to determine execution order
-        visited = set()
-        temp_visited = set()
-        order = []
-
-        def visit(node):
-            if node in temp_visited:
-                raise ValueError(f"Circular dependency detected at {node}")
-            if node not in visited:
-                temp_visited.add(node)
-                for neighbor in self.dependency_graph.get(node, []):
-                    if neighbor in self.skills:
-                        visit(neighbor)
-                temp_visited.remove(node)
-                visited.add(node)
-                order.append(node)
-
-        for skill_name in self.skills.keys():
-            if skill_name not in visited:
-                visit(skill_name)
-
-        self.execution_order = order
+        # Kahn's algorithm over the integer CSR graph
+        indptr = self._graph_indptr
+        indices = self._graph_indices
+        in_degree = array("i", self._graph_in_degree)
+
+        ready = deque(idx for idx, degree in enumerate(in_degree) if degree == 0)
+        order_ids = []
+        while ready:
+            node = ready.popleft()
+            order_ids.append(node)
+            for pos in range(indptr[node], indptr[node + 1]):
+                target = indices[pos]
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    ready.append(target)
+
+        if len(order_ids) < len(in_degree):
+            cycle = self._find_cycle({idx for idx, degree in enumerate(in_degree) if degree > 0})
+            raise ValueError(f"Circular dependency detected: {' -> '.join(cycle)}")
+
+        self.execution_order = [self._id_to_name[idx] for idx in order_ids]
+
+    def _find_cycle(self, unresolved: set) -> List[str]:
+        """Return one dependency cycle among the skills Kahn's algorithm left over.
+
+        Every unresolved skill has an unresolved dependency, so walking
+        dependencies from any of them must revisit a skill; the walk from
+        that skill's first visit is a cycle.
+
+        Args:
+            unresolved: Ids of the skills whose in-degree never reached zero
+
+        Returns:
+            Skill names along the cycle, ending with the first name repeated
+        """
+        path: List[int] = []
+        seen: Dict[int, int] = {}
+        node = min(unresolved)
+        while node not in seen:
+            seen[node] = len(path)
+            path.append(node)
+            node = next(
+                dep_id for dep_id in (
+                    self._name_to_id.get(dep_name) for dep_name in self.dependency_graph[self._id_to_name[node]]
+                )
+                if dep_id in unresolved
+            )
+        cycle = path[seen[node]:] + [node]
+        return [self._id_to_name[idx] for idx in reversed(cycle)]
+
+    def calculate_load_layers(self) -> List[List[str]]:
+        """Group registered skills into layers that can be loaded concurrently.
+
+        Every skill appears in a later layer than the registered skills it
+        depends on, so layers must be processed in order.
+
+        Returns:
+            List of layers, each a list of skill names
+        """
+        pending = {
+            name: {dep for dep in config.get("dependencies", []) if dep in self.skill_configs}
+            for name, config in self.skill_configs.items()
+        }
+
+        layers = []
+        while pending:
+            layer = [name for name, deps in pending.items() if not deps]
+            if not layer:
+                raise ValueError(f"Circular dependency detected among {sorted(pending)}")
+            for name in layer:
+                del pending[name]
+            for deps in pending.values():
+                deps.difference_update(layer)
+            layers.append(layer)
+
+        return layers
 
     async def batch_execute(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Execute multiple skill operations in dependency order.
@@ -398,9 +539,14 @@ class SkillRegistry:
         Returns:
             List of execution results
         """
-        # Build dependency graph and calculate order
-        self.build_dependency_graph()
-        self.calculate_execution_order()
+        # Build dependency graph and calculate order, reusing the cached
+        # result when no skill has been registered, loaded or unloaded since
+        if self._graph_cache and self._graph_cache[0] == self._graph_version:
+            _, self.dependency_graph, self.execution_order = self._graph_cache
+        else:
+            self.build_dependency_graph()
+            self.calculate_execution_order()
+            self._graph_cache = (self._graph_version, self.dependency_graph, self.execution_order)
 
         results = []
         for op in operations:
@@ -432,19 +578,25 @@ class SkillRegistry:
             "dependency_info": {}
         }
 
+        # Reverse-dependency index, built in one pass over all edges
+        required_by = defaultdict(list)
+        for name, s in self.skills.items():
+            for dep in s.dependencies:
+                required_by[dep.name].append(name)
+
         for skill_name, skill in self.skills.items():
             report["statuses"][skill_name] = {
                 "status": skill.status.value,
                 "enabled": skill.metadata.enabled,
                 "version": skill.metadata.version,
-                "last_updated": skill.metadata.last_updated.isoformat(),
+                "last_updated": skill.metadata.last_updated_iso,
                 "execution_stats": skill.metadata.execution_stats
             }
 
             # Dependencies
             report["dependency_info"][skill_name] = {
                 "depends_on": [dep.name for dep in skill.dependencies],
-                "required_by": [name for name, s in self.skills.items() if skill_name in [dep.name for dep in s.dependencies]]
+                "required_by": required_by.get(skill_name, [])
             }
 
         return report
@@ -460,7 +612,7 @@ class SkillFramework:
             vault_path: Path to vault for configuration storage
         """
         self.registry = SkillRegistry(vault_path)
-        self.vault_manager = VaultManager(vault_path)
+        self.vault_manager = get_vault_manager(vault_path)
         self.config_loader = ConfigLoader(vault_path)
 
     async def initialize(self):
@@ -473,9 +625,8 @@ class SkillFramework:
         for skill_config in default_skills:
             self.registry.register_skill(None, skill_config)
 
-        # Load all registered skills
-        for skill_name in self.registry.skill_configs.keys():
-            await self.registry.load_skill(skill_name)
+        # Load all registered skills, one dependency layer at a time
+        await self._load_registered_skills()
 
     async def execute_skill(self, skill_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a skill with given parameters.
@@ -521,10 +672,11 @@ class SkillFramework:
         """Reload configuration and update skill registrations."""
         config = await self.config_loader.load_config()
 
-        # Unregister all skills
-        for skill_name in list(self.registry.skill_configs.keys()):
-            await self.registry.unload_skill(skill_name)
-            del self.registry.skill_configs[skill_name]
+        # Unregister all skills, dependents before their dependencies
+        for layer in reversed(self.registry.calculate_load_layers()):
+            await asyncio.gather(*(self.registry.unload_skill(name) for name in layer))
+        self.registry.skill_configs.clear()
+        self.registry.bump_version()
 
         # Re-register skills from config
         default_skills = config.get("default_skills", [])
@@ -532,8 +684,19 @@ class SkillFramework:
             self.registry.register_skill(None, skill_config)
 
         # Reload all skills
-        for skill_name in self.registry.skill_configs.keys():
-            await self.registry.load_skill(skill_name)
+        await self._load_registered_skills()
+
+    async def _load_registered_skills(self):
+        """Load registered skills concurrently within each dependency layer."""
+        for layer in self.registry.calculate_load_layers():
+            await asyncio.gather(*(self.registry.load_skill(name) for name in layer))
+
+
+def _dump_config(config: Dict[str, Any]) -> str:
+    """Serialize a configuration as compact JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(config).decode()
+    return json.dumps(config, separators=(",", ":"))
 
 
 class ConfigLoader:
@@ -545,7 +708,7 @@ class ConfigLoader:
         Args:
             vault_path: Path to vault for configuration storage
         """
-        self.vault_manager = VaultManager(vault_path)
+        self.vault_manager = get_vault_manager(vault_path)
 
     async def load_config(self) -> Dict[str, Any]:
         """Load skill configuration.
@@ -557,7 +720,7 @@ class ConfigLoader:
             # Try to load from vault
             config_content = self.vault_manager.get_content("skill_config.json")
             if config_content:
-                return json.loads(config_content)
+                return orjson.loads(config_content) if ORJSON_AVAILABLE else json.loads(config_content)
         except Exception:
             pass
 
@@ -597,11 +760,11 @@ class ConfigLoader:
         try:
             self.vault_manager.save_content(
                 "skill_config",
-                json.dumps(config, indent=2),
+                _dump_config(config),
                 category="config"
             )
-        except Exception as e:
-            print(f"Error saving skill config: {e}")
+        except Exception:
+            logger.exception("Error saving skill config")
 
 
 # Core business skills
@@ -646,10 +809,16 @@ class BusinessIntelligenceSkill(BaseSkill):
 
         # Analyze market trends
         for indicator in trend_indicators:
-            if "growth" in indicator.lower():
-                opportunities.append(f"Growth opportunity in {indicator.replace('growth', '').strip()}")
-            elif "decline" in indicator.lower():
-                threats.append(f"Declining trend in {indicator.replace('decline', '').strip()}")
+            lowered = indicator.lower()
+            idx = lowered.find("growth")
+            if idx != -1:
+                subject = indicator[:idx] + indicator[idx + 6:]
+                opportunities.append(f"Growth opportunity in {subject.strip()}")
+                continue
+            idx = lowered.find("decline")
+            if idx != -1:
+                subject = indicator[:idx] + indicator[idx + 7:]
+                threats.append(f"Declining trend in {subject.strip()}")
 
         # Generate recommendations
         if opportunities:
@@ -704,15 +873,33 @@ class CustomerOutreachSkill(BaseSkill):
         sent = []
         failed = []
 
+        # Split the template once; plain {field} placeholders are then filled
+        # by joining pre-split chunks instead of re-parsing it per customer
+        try:
+            segments = list(string.Formatter().parse(message_template))
+        except ValueError:
+            # Malformed template; let format_map report the error per customer
+            segments = [(None, "", None, None)]
+        simple_template = all(
+            field is None or (field.isidentifier() and not spec and not conversion)
+            for _, field, spec, conversion in segments
+        )
+
         for customer in customers:
             try:
                 # Simulate sending message
-                message = message_template.format(**customer)
+                if simple_template:
+                    message = "".join(
+                        literal + (str(customer[field]) if field is not None else "")
+                        for literal, field, _, _ in segments
+                    )
+                else:
+                    message = message_template.format_map(customer)
 
                 # Log as sent (in a real system, this would actually send)
                 sent.append({
                     "customer_id": customer.get("id"),
-                    "message": message[:50] + "...",
+                    "message": message if len(message) <= 50 else message[:50] + "...",
                     "channel": channel,
                     "status": "sent"
                 })
@@ -728,6 +915,15 @@ class CustomerOutreachSkill(BaseSkill):
         }
 
 
+# Simple stage progression: (current stage, action) -> next stage
+_STAGE_TRANSITIONS = {
+    ("prospect", "qualify"): "qualified",
+    ("qualified", "propose"): "proposal",
+    ("proposal", "negotiate"): "negotiation",
+    ("negotiation", "close"): "closed_won",
+}
+
+
 class SalesPipelineSkill(BaseSkill):
     """Manages lead management and nurturing in the sales pipeline."""
 
@@ -765,6 +961,7 @@ class SalesPipelineSkill(BaseSkill):
         """Manage the sales pipeline for given leads."""
         moved = []
         updated = []
+        now_iso = datetime.now().isoformat()
 
         for lead in leads:
             try:
@@ -775,7 +972,7 @@ class SalesPipelineSkill(BaseSkill):
                 updated_lead = {
                     **lead,
                     "stage": next_stage,
-                    "last_contacted": datetime.now().isoformat()
+                    "last_contacted": now_iso
                 }
 
                 moved.append(updated_lead)
@@ -792,27 +989,22 @@ class SalesPipelineSkill(BaseSkill):
 
     def _determine_next_stage(self, current_stage: str, actions: List[str]) -> str:
         """Determine the next stage based on current stage and actions."""
-        # Simple stage progression
-        stages = ["prospect", "qualified", "proposal", "negotiation", "closed_won", "closed_lost"]
-
-        try:
-            current_idx = stages.index(current_stage)
-        except ValueError:
-            current_idx = 0
-
         # Move to next stage if appropriate action is taken
-        if "qualify" in actions and current_stage == "prospect":
-            return "qualified"
-        elif "propose" in actions and current_stage == "qualified":
-            return "proposal"
-        elif "negotiate" in actions and current_stage == "proposal":
-            return "negotiation"
-        elif "close" in actions and current_stage == "negotiation":
-            return "closed_won"
+        for action in actions:
+            next_stage = _STAGE_TRANSITIONS.get((current_stage, action))
+            if next_stage:
+                return next_stage
 
         return current_stage
 
 
+# Alternating weekly content format and channels, indexed by week parity
+_WEEKLY_CONTENT_PATTERNS = (
+    ("blog", ("linkedin", "blog")),
+    ("video", ("youtube", "linkedin")),
+)
+
+
 class ContentStrategySkill(BaseSkill):
     """Manages content planning and optimization."""
 
@@ -852,13 +1044,15 @@ class ContentStrategySkill(BaseSkill):
         """Develop a comprehensive content strategy."""
         # Generate content calendar
         calendar = []
+        goal_count = len(goals)
         for i, topic in enumerate(topics[:4]):  # Limit to 4 topics
+            content_format, channels = _WEEKLY_CONTENT_PATTERNS[i & 1]
             calendar.append({
                 "week": i + 1,
                 "topic": topic,
-                "format": "blog" if i % 2 == 0 else "video",
-                "channels": ["linkedin", "blog"] if i % 2 == 0 else ["youtube", "linkedin"],
-                "goal": goals[i % len(goals)] if goals else "awareness"
+                "format": content_format,
+                "channels": list(channels),
+                "goal": goals[i % goal_count] if goal_count else "awareness"
             })
 
         return {
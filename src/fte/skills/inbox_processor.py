@@ -1,14 +1,51 @@
 """Inbox Processor Skill - Analyze and categorize inbox items."""
 
+import re
+from functools import lru_cache
 from pathlib import Path
-import sys
 
-# Add the src directory to the Python path
-src_path = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(src_path))
+from ..vault_manager import VaultManager
+from .email_response_generator import process_inbox_for_responses
 
-from fte.vault_manager import VaultManager
-from fte.skills.email_response_generator import process_inbox_for_responses
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Keyword groups in priority order, with the suggestion each one triggers
+_CATEGORY_RULES = (
+    (("urgent", "asap", "important", "deadline", "critical"),
+     "URGENT: Move to Needs_Action immediately"),
+    (("reference", "documentation", "guide", "manual", "howto"),
+     "Reference material: Consider archiving to Done"),
+    (("task", "todo", "action", "follow-up", "review"),
+     "Task item: Move to Needs_Action"),
+    (("meeting", "notes", "minutes", "agenda"),
+     "Meeting notes: Review and extract action items"),
+)
+
+_DEFAULT_SUGGESTION = "Review and categorize manually"
+
+
+def _build_category_automaton():
+    """Build an Aho-Corasick automaton mapping each keyword to its rule priority."""
+    automaton = ahocorasick.Automaton()
+    for priority, (keywords, _) in enumerate(_CATEGORY_RULES):
+        for keyword in keywords:
+            automaton.add_word(keyword, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+_CATEGORY_AUTOMATON = _build_category_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Fallback: one literal alternation per keyword group, matched on lowercased text
+_CATEGORY_PATTERNS = tuple(
+    (re.compile("|".join(map(re.escape, keywords))), suggestion)
+    for keywords, suggestion in _CATEGORY_RULES
+)
 
 
 def process_inbox(vault_path: str | Path | None = None) -> dict:
@@ -23,8 +60,18 @@ def process_inbox(vault_path: str | Path | None = None) -> dict:
         Dictionary with processing results
     """
     manager = VaultManager(vault_path)
-    items = manager.get_inbox_items()
+    return _process_items(manager.get_inbox_items())
 
+
+def _process_items(items: list[dict]) -> dict:
+    """Categorize already-loaded inbox items.
+
+    Args:
+        items: Inbox items as returned by VaultManager.get_inbox_items
+
+    Returns:
+        Dictionary with processing results
+    """
     results = {
         "total_items": len(items),
         "items": [],
@@ -36,26 +83,35 @@ def process_inbox(vault_path: str | Path | None = None) -> dict:
         return results
 
     for item in items:
-        item_info = {
-            "name": item["name"],
-            "path": str(item["path"]),
-            "preview": item["preview"],
-            "modified": item["modified"].isoformat(),
-        }
-
-        # Basic categorization based on content/name patterns
-        suggestion = categorize_item(item["name"], item["preview"])
-        item_info["suggested_action"] = suggestion
-
+        item_info = _build_item_info(item)
         results["items"].append(item_info)
         results["suggestions"].append(
-            f"{item['name']}: {suggestion}"
+            f"{item['name']}: {item_info['suggested_action']}"
         )
 
     results["message"] = f"Processed {len(items)} items"
     return results
 
 
+def _build_item_info(item: dict) -> dict:
+    """Build the result entry for one inbox item, including its suggestion.
+
+    Args:
+        item: Inbox item as returned by VaultManager.get_inbox_items
+
+    Returns:
+        Dictionary describing the item and its suggested action
+    """
+    return {
+        "name": item["name"],
+        "path": str(item["path"]),
+        "preview": item["preview"],
+        "modified": item["modified"].isoformat(),
+        # Basic categorization based on content/name patterns
+        "suggested_action": categorize_item(item["name"], item["preview"]),
+    }
+
+
 def process_inbox_with_ai_responses(vault_path: str | Path | None = None) -> dict:
     """Process all items in the Inbox folder and generate AI responses for them.
 
@@ -65,11 +121,17 @@ def process_inbox_with_ai_responses(vault_path: str | Path | None = None) -> dic
     Returns:
         Dictionary with processing results including AI response generation
     """
+    # Scan the inbox once and share the items between both passes
+    manager = VaultManager(vault_path)
+    items = manager.get_inbox_items()
+
     # First, process the inbox normally
-    normal_results = process_inbox(vault_path)
+    normal_results = _process_items(items)
 
     # Then generate AI responses for all emails
-    ai_results = process_inbox_for_responses(vault_path)
+    ai_results = process_inbox_for_responses(
+        vault_path, inbox_files=[item["path"] for item in items]
+    )
 
     # Combine results
     combined_results = {
@@ -85,6 +147,7 @@ def process_inbox_with_ai_responses(vault_path: str | Path | None = None) -> dic
     return combined_results
 
 
+@lru_cache(maxsize=4096)
 def categorize_item(name: str, content: str) -> str:
     """Suggest categorization for an item based on content analysis.
 
@@ -95,31 +158,38 @@ def categorize_item(name: str, content: str) -> str:
     Returns:
         Suggested action
     """
-    name_lower = name.lower()
-    content_lower = content.lower()
+    # Lowercase once; keywords never contain a newline, so joining the name
+    # and preview cannot create matches across the boundary
+    return _categorize_text(f"{name}\n{content}".lower())
 
-    # Check for urgency indicators
-    urgent_keywords = ["urgent", "asap", "important", "deadline", "critical"]
-    if any(kw in name_lower or kw in content_lower for kw in urgent_keywords):
-        return "URGENT: Move to Needs_Action immediately"
 
-    # Check for reference material
-    reference_keywords = ["reference", "documentation", "guide", "manual", "howto"]
-    if any(kw in name_lower or kw in content_lower for kw in reference_keywords):
-        return "Reference material: Consider archiving to Done"
+def _categorize_text(text_lower: str) -> str:
+    """Suggest an action for lowercased item text.
 
-    # Check for task indicators
-    task_keywords = ["task", "todo", "action", "follow-up", "review"]
-    if any(kw in name_lower or kw in content_lower for kw in task_keywords):
-        return "Task item: Move to Needs_Action"
+    Args:
+        text_lower: Lowercased file name and preview, newline-separated
 
-    # Check for meeting notes
-    meeting_keywords = ["meeting", "notes", "minutes", "agenda"]
-    if any(kw in name_lower or kw in content_lower for kw in meeting_keywords):
-        return "Meeting notes: Review and extract action items"
+    Returns:
+        Suggested action
+    """
+    if _CATEGORY_AUTOMATON is not None:
+        # Single pass over the text; the lowest priority seen wins
+        best = len(_CATEGORY_RULES)
+        for _, priority in _CATEGORY_AUTOMATON.iter(text_lower):
+            if priority < best:
+                if priority == 0:
+                    return _CATEGORY_RULES[0][1]
+                best = priority
+        if best < len(_CATEGORY_RULES):
+            return _CATEGORY_RULES[best][1]
+        return _DEFAULT_SUGGESTION
+
+    for pattern, suggestion in _CATEGORY_PATTERNS:
+        if pattern.search(text_lower):
+            return suggestion
 
     # Default suggestion
-    return "Review and categorize manually"
+    return _DEFAULT_SUGGESTION
 
 
 def get_inbox_summary(vault_path: str | Path | None = None) -> str:
@@ -2,12 +2,162 @@
 LinkedIn Post Generator - Generates business-focused content from vault data
 and optimizes for engagement and sales leads.
 """
+import hashlib
+import json
 import random
-from datetime import datetime
+import string
+import textwrap
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from ..vault_manager import VaultManager
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Business-focused post templates
+_BUSINESS_TEMPLATES = (
+    MappingProxyType({
+        "type": "success_story",
+        "template": "🌟 Success Story: {accomplishment}\n\nWe recently helped {client} achieve {result} by {method}. \n\nKey takeaways:\n✅ {takeaway1}\n✅ {takeaway2}\n✅ {takeaway3}\n\n{call_to_action}",
+        "tags": ("case study", "success", "results")
+    }),
+    MappingProxyType({
+        "type": "industry_insight",
+        "template": "📊 Industry Insight: {trend}\n\n{insight_explanation}\n\nThis shift means {implication} for businesses like {target_audience}.\n\nWhat's your experience with {related_topic}? Share your thoughts below! 👇\n\n{call_to_action}",
+        "tags": ("insight", "trend", "analysis")
+    }),
+    MappingProxyType({
+        "type": "tip_tuesday",
+        "template": "💡 Tip Tuesday: {tip_topic}\n\n{tip_explanation}\n\nTry this approach:\n1. {step1}\n2. {step2}\n3. {step3}\n\nHow do you handle {tip_topic} in your business? Let's discuss! 💬\n\n{call_to_action}",
+        "tags": ("tips", "advice", "tutorial")
+    }),
+    MappingProxyType({
+        "type": "thought_leadership",
+        "template": "🤔 Thought Leadership: {topic}\n\n{current_state}\n\nI believe the future belongs to companies that {prediction}. Here's why:\n\n{i_reason1}\n{i_reason2}\n{i_reason3}\n\nWhat's your perspective? I'd love to hear your thoughts! 🤝\n\n{call_to_action}",
+        "tags": ("leadership", "future", "prediction")
+    }),
+    MappingProxyType({
+        "type": "behind_scenes",
+        "template": "🔍 Behind the Scenes: {activity}\n\nToday we're working on {project_details}.\n\n{behind_scenes_detail}\n\nIt's moments like these that remind us why we do what we do. 🚀\n\n{call_to_action}",
+        "tags": ("behind scenes", "culture", "process")
+    }),
+)
+
+_TEMPLATES_BY_TYPE = {template["type"]: template for template in _BUSINESS_TEMPLATES}
+
+# Templates pre-split into (literal, placeholder) segments, parsed once at import
+_COMPILED_TEMPLATES = {
+    template["type"]: tuple(
+        (literal, field) for literal, field, _, _ in string.Formatter().parse(template["template"])
+    )
+    for template in _BUSINESS_TEMPLATES
+}
+
+# Engagement optimization strategies
+_ENGAGEMENT_STRATEGIES = (
+    "Ask a question at the end to encourage comments",
+    "Include a relevant statistic to add credibility",
+    "Use emojis strategically to break up text",
+    "Keep paragraphs short for mobile readability",
+    "End with a clear call-to-action",
+    "Use the 'hook, story, takeaway' format",
+    "Include relevant hashtags (#Business #Leadership #Growth)",
+    "Tag relevant people or companies when appropriate",
+    "Share personal experiences to build connection",
+    "Provide actionable insights that readers can implement",
+)
+
+# Content keyword -> hashtags to suggest
+_HASHTAG_MAPPING = MappingProxyType({
+    'business': ('#Business', '#Entrepreneurship', '#Leadership'),
+    'success': ('#Success', '#Achievement', '#Results'),
+    'innovation': ('#Innovation', '#Tech', '#Future'),
+    'growth': ('#Growth', '#Development', '#Progress'),
+    'team': ('#Teamwork', '#Collaboration', '#Culture'),
+    'leadership': ('#Leadership', '#Management', '#Inspiration'),
+    'project': ('#ProjectManagement', '#Strategy', '#Execution'),
+    'client': ('#CustomerFocus', '#Service', '#Relationships'),
+    'solution': ('#ProblemSolving', '#Innovation', '#Value'),
+    'technology': ('#Tech', '#DigitalTransformation', '#Innovation')
+})
+
+# Vault folders scanned by VaultManager.get_recent_content
+_ANALYZED_FOLDERS = ("Inbox", "Needs_Action", "Done")
+
+# Tuesday-Thursday, 8-10 AM and 12-2 PM are typically best: morning, lunch, evening
+_OPTIMAL_POSTING_HOURS = (8, 12, 17)
+
+# Hashtags appended to every business post
+_DEFAULT_HASHTAGS = ('#Business', '#Professional', '#Networking', '#Growth')
+
+# Random content pools for the generated post types
+_AUTO_FALLBACK_POST_TYPES = ("success_story", "industry_insight", "thought_leadership")
+
+_TRENDS = (
+    "digital transformation acceleration",
+    "remote work evolution",
+    "AI integration in business processes",
+    "sustainability becoming mainstream",
+    "customer experience taking priority",
+)
+
+_INSIGHTS = (
+    "The companies adapting fastest to change are the ones investing in both technology and people.",
+    "Success in today's market requires balancing innovation with operational excellence.",
+    "The most resilient businesses are those that prioritize agility and adaptability.",
+)
+
+_TIPS = (
+    "effective communication",
+    "strategic planning",
+    "team collaboration",
+    "time management",
+    "customer relationship building",
+)
+
+_TOPICS = (
+    "the future of work",
+    "business innovation",
+    "leadership in challenging times",
+    "technology adoption",
+    "organizational culture",
+)
+
+_ACTIVITIES = (
+    "developing a new methodology",
+    "working on an innovative solution",
+    "collaborating with our team",
+    "refining our approach",
+    "implementing best practices",
+)
+
+# Keywords that mark vault content as business-relevant
+_BUSINESS_INDICATORS = (
+    'project', 'client', 'result', 'success', 'challenge', 'solution',
+    'strategy', 'growth', 'opportunity', 'innovation', 'achievement'
+)
+
+
+def _build_keyword_automaton(keywords):
+    """Build an Aho-Corasick automaton that yields each matched keyword."""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+if AHOCORASICK_AVAILABLE:
+    _HASHTAG_AC = _build_keyword_automaton(_HASHTAG_MAPPING)
+    _INDICATOR_AC = _build_keyword_automaton(_BUSINESS_INDICATORS)
+else:
+    _HASHTAG_AC = _INDICATOR_AC = None
+
 
 class LinkedInPostGenerator:
     """Generates business-focused LinkedIn posts from vault content."""
@@ -21,54 +171,44 @@ class LinkedInPostGenerator:
         self.vault_manager = VaultManager(vault_path)
         self.business_templates = self._load_business_templates()
         self.engagement_strategies = self._load_engagement_strategies()
+        self._analysis_cache: Optional[Dict[str, Any]] = None
+        self._analysis_signature: Optional[tuple] = None
 
-    def _load_business_templates(self) -> List[Dict[str, str]]:
+    def _load_business_templates(self) -> Tuple[Mapping[str, Any], ...]:
         """Load business-focused post templates."""
-        return [
-            {
-                "type": "success_story",
-                "template": "🌟 Success Story: {accomplishment}\n\nWe recently helped {client} achieve {result} by {method}. \n\nKey takeaways:\n✅ {takeaway1}\n✅ {takeaway2}\n✅ {takeaway3}\n\n{call_to_action}",
-                "tags": ["case study", "success", "results"]
-            },
-            {
-                "type": "industry_insight",
-                "template": "📊 Industry Insight: {trend}\n\n{insight_explanation}\n\nThis shift means {implication} for businesses like {target_audience}.\n\nWhat's your experience with {related_topic}? Share your thoughts below! 👇\n\n{call_to_action}",
-                "tags": ["insight", "trend", "analysis"]
-            },
-            {
-                "type": "tip_tuesday",
-                "template": "💡 Tip Tuesday: {tip_topic}\n\n{tip_explanation}\n\nTry this approach:\n1. {step1}\n2. {step2}\n3. {step3}\n\nHow do you handle {tip_topic} in your business? Let's discuss! 💬\n\n{call_to_action}",
-                "tags": ["tips", "advice", "tutorial"]
-            },
-            {
-                "type": "thought_leadership",
-                "template": "🤔 Thought Leadership: {topic}\n\n{current_state}\n\nI believe the future belongs to companies that {prediction}. Here's why:\n\n{i_reason1}\n{i_reason2}\n{i_reason3}\n\nWhat's your perspective? I'd love to hear your thoughts! 🤝\n\n{call_to_action}",
-                "tags": ["leadership", "future", "prediction"]
-            },
-            {
-                "type": "behind_scenes",
-                "template": "🔍 Behind the Scenes: {activity}\n\nToday we're working on {project_details}.\n\n{behind_scenes_detail}\n\nIt's moments like these that remind us why we do what we do. 🚀\n\n{call_to_action}",
-                "tags": ["behind scenes", "culture", "process"]
-            }
-        ]
+        return _BUSINESS_TEMPLATES
 
-    def _load_engagement_strategies(self) -> List[str]:
+    def _load_engagement_strategies(self) -> Tuple[str, ...]:
         """Load engagement optimization strategies."""
-        return [
-            "Ask a question at the end to encourage comments",
-            "Include a relevant statistic to add credibility",
-            "Use emojis strategically to break up text",
-            "Keep paragraphs short for mobile readability",
-            "End with a clear call-to-action",
-            "Use the 'hook, story, takeaway' format",
-            "Include relevant hashtags (#Business #Leadership #Growth)",
-            "Tag relevant people or companies when appropriate",
-            "Share personal experiences to build connection",
-            "Provide actionable insights that readers can implement"
-        ]
+        return _ENGAGEMENT_STRATEGIES
+
+    def _vault_signature(self) -> tuple:
+        """Fingerprint the vault folders scanned by get_recent_content.
+
+        Folder mtimes change when notes are added, removed or moved, and file
+        mtimes change on edits. The date is included so notes still age out of
+        the 30-day window.
+        """
+        latest_mtime = 0
+        for folder_name in _ANALYZED_FOLDERS:
+            folder_path = self.vault_manager.vault_path / folder_name
+            if not folder_path.exists():
+                continue
+            latest_mtime = max(latest_mtime, folder_path.stat().st_mtime_ns)
+            for file_path in folder_path.iterdir():
+                if file_path.suffix == ".md":
+                    latest_mtime = max(latest_mtime, file_path.stat().st_mtime_ns)
+        return (datetime.now().date(), latest_mtime)
 
     def analyze_vault_content(self) -> Dict[str, Any]:
-        """Analyze vault content for business-relevant topics."""
+        """Analyze vault content for business-relevant topics.
+
+        Results are cached until the vault content changes.
+        """
+        signature = self._vault_signature()
+        if self._analysis_cache is not None and signature == self._analysis_signature:
+            return self._analysis_cache
+
         vault_content = self.vault_manager.get_recent_content(days=30)
 
         analysis = {
@@ -85,13 +225,15 @@ class LinkedInPostGenerator:
             title = content_item.get('title', '')
 
             # Look for business themes
-            business_indicators = [
-                'project', 'client', 'result', 'success', 'challenge', 'solution',
-                'strategy', 'growth', 'opportunity', 'innovation', 'achievement'
-            ]
-
-            indicators_found = [indicator for indicator in business_indicators
-                              if indicator.lower() in text.lower() or indicator.lower() in title.lower()]
+            # Lowercase once; indicators are already lowercase and never contain
+            # a newline, so title and text can be searched as one string
+            combined_lower = f"{title}\n{text}".lower()
+            if _INDICATOR_AC is not None:
+                matched = {keyword for _, keyword in _INDICATOR_AC.iter(combined_lower)}
+                indicators_found = [indicator for indicator in _BUSINESS_INDICATORS if indicator in matched]
+            else:
+                indicators_found = [indicator for indicator in _BUSINESS_INDICATORS
+                                  if indicator in combined_lower]
 
             if indicators_found:
                 analysis["potential_stories"].append({
@@ -101,6 +243,8 @@ class LinkedInPostGenerator:
                     "relevance_score": len(indicators_found)
                 })
 
+        self._analysis_cache = analysis
+        self._analysis_signature = signature
         return analysis
 
     def generate_post_from_template(self, template_type: str, **kwargs) -> Dict[str, Any]:
@@ -114,15 +258,19 @@ class LinkedInPostGenerator:
             Dictionary containing post content and metadata
         """
         # Find the template
-        template = next((t for t in self.business_templates if t["type"] == template_type), None)
+        template = _TEMPLATES_BY_TYPE.get(template_type)
         if not template:
             raise ValueError(f"Template '{template_type}' not found")
 
         # Fill in the template
-        try:
-            post_content = template["template"].format(**kwargs)
-        except KeyError as e:
-            raise ValueError(f"Missing required parameter for template '{template_type}': {e}")
+        parts = []
+        for literal, field in _COMPILED_TEMPLATES[template_type]:
+            parts.append(literal)
+            if field is not None:
+                if field not in kwargs:
+                    raise ValueError(f"Missing required parameter for template '{template_type}': '{field}'")
+                parts.append(str(kwargs[field]))
+        post_content = "".join(parts)
 
         # Optimize for engagement
         optimized_post = self._optimize_for_engagement(post_content)
@@ -161,7 +309,7 @@ class LinkedInPostGenerator:
                 elif "insight" in best_story["indicators"] or "trend" in best_story["indicators"]:
                     post_type = "industry_insight"
                 else:
-                    post_type = random.choice(["success_story", "industry_insight", "thought_leadership"])
+                    post_type = random.choice(_AUTO_FALLBACK_POST_TYPES)
 
         # Generate specific content based on post type
         if post_type == "success_story":
@@ -209,23 +357,9 @@ class LinkedInPostGenerator:
 
     def _generate_insight_post(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate an industry insight post."""
-        trends = [
-            "digital transformation acceleration",
-            "remote work evolution",
-            "AI integration in business processes",
-            "sustainability becoming mainstream",
-            "customer experience taking priority"
-        ]
-
-        insights = [
-            "The companies adapting fastest to change are the ones investing in both technology and people.",
-            "Success in today's market requires balancing innovation with operational excellence.",
-            "The most resilient businesses are those that prioritize agility and adaptability."
-        ]
-
         content = {
-            "trend": random.choice(trends),
-            "insight_explanation": random.choice(insights),
+            "trend": random.choice(_TRENDS),
+            "insight_explanation": random.choice(_INSIGHTS),
             "implication": "organizations must evolve their strategies",
             "target_audience": "forward-thinking leaders",
             "related_topic": "digital transformation",
@@ -236,16 +370,8 @@ class LinkedInPostGenerator:
 
     def _generate_tip_post(self) -> Dict[str, Any]:
         """Generate a tip-based post."""
-        tips = [
-            "effective communication",
-            "strategic planning",
-            "team collaboration",
-            "time management",
-            "customer relationship building"
-        ]
-
         content = {
-            "tip_topic": random.choice(tips),
+            "tip_topic": random.choice(_TIPS),
             "tip_explanation": "This approach has consistently delivered positive results in my experience.",
             "step1": "Identify your core objective",
             "step2": "Develop a clear action plan",
@@ -257,17 +383,10 @@ class LinkedInPostGenerator:
 
     def _generate_thought_leadership_post(self) -> Dict[str, Any]:
         """Generate a thought leadership post."""
-        topics = [
-            "the future of work",
-            "business innovation",
-            "leadership in challenging times",
-            "technology adoption",
-            "organizational culture"
-        ]
-
+        topic = random.choice(_TOPICS)
         content = {
-            "topic": random.choice(topics),
-            "current_state": f"We're at an inflection point where traditional approaches to {random.choice(topics)} are being challenged.",
+            "topic": topic,
+            "current_state": f"We're at an inflection point where traditional approaches to {topic} are being challenged.",
             "prediction": "embrace flexibility and continuous learning",
             "i_reason1": "Market demands are evolving rapidly",
             "i_reason2": "Technology is enabling new possibilities",
@@ -279,16 +398,8 @@ class LinkedInPostGenerator:
 
     def _generate_behind_scenes_post(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a behind-the-scenes post."""
-        activities = [
-            "developing a new methodology",
-            "working on an innovative solution",
-            "collaborating with our team",
-            "refining our approach",
-            "implementing best practices"
-        ]
-
         content = {
-            "activity": random.choice(activities),
+            "activity": random.choice(_ACTIVITIES),
             "project_details": "an exciting initiative that aligns with our core values",
             "behind_scenes_detail": "It's the attention to detail and commitment to excellence that makes the difference.",
             "call_to_action": "What's happening behind the scenes in your organization? I'd enjoy hearing about your experiences! 👀"
@@ -304,22 +415,16 @@ class LinkedInPostGenerator:
 
         # Add strategic line breaks for readability
         paragraphs = content.split('\n')
-        optimized_paragraphs = []
+        if max(map(len, paragraphs)) <= 80:
+            return content
 
+        optimized_paragraphs = []
         for para in paragraphs:
             if len(para) > 80:  # Split long lines
                 # Simple word wrap at ~80 characters
-                words = para.split()
-                current_line = ""
-                for word in words:
-                    if len(current_line + " " + word) <= 80:
-                        current_line += " " + word
-                    else:
-                        if current_line:
-                            optimized_paragraphs.append(current_line.strip())
-                        current_line = word
-                if current_line:
-                    optimized_paragraphs.append(current_line.strip())
+                optimized_paragraphs.extend(
+                    textwrap.wrap(para, width=80, break_long_words=False, break_on_hyphens=False)
+                )
             else:
                 optimized_paragraphs.append(para)
 
@@ -329,30 +434,21 @@ class LinkedInPostGenerator:
         """Generate relevant hashtags based on content."""
         content_lower = content.lower()
 
-        hashtag_mapping = {
-            'business': ['#Business', '#Entrepreneurship', '#Leadership'],
-            'success': ['#Success', '#Achievement', '#Results'],
-            'innovation': ['#Innovation', '#Tech', '#Future'],
-            'growth': ['#Growth', '#Development', '#Progress'],
-            'team': ['#Teamwork', '#Collaboration', '#Culture'],
-            'leadership': ['#Leadership', '#Management', '#Inspiration'],
-            'project': ['#ProjectManagement', '#Strategy', '#Execution'],
-            'client': ['#CustomerFocus', '#Service', '#Relationships'],
-            'solution': ['#ProblemSolving', '#Innovation', '#Value'],
-            'technology': ['#Tech', '#DigitalTransformation', '#Innovation']
-        }
+        if _HASHTAG_AC is not None:
+            matched = {keyword for _, keyword in _HASHTAG_AC.iter(content_lower)}
+        else:
+            matched = {keyword for keyword in _HASHTAG_MAPPING if keyword in content_lower}
 
-        relevant_hashtags = set()
-        for keyword, tags in hashtag_mapping.items():
-            if keyword in content_lower:
-                relevant_hashtags.update(tags)
+        # Insertion-ordered dict keeps the output stable and free of duplicates
+        all_hashtags = dict.fromkeys(
+            tag for keyword, tags in _HASHTAG_MAPPING.items() if keyword in matched for tag in tags
+        )
 
         # Default hashtags for business posts
-        default_hashtags = ['#Business', '#Professional', '#Networking', '#Growth']
-        all_hashtags = list(relevant_hashtags) + default_hashtags
+        all_hashtags.update(dict.fromkeys(_DEFAULT_HASHTAGS))
 
         # Limit to 5-10 relevant hashtags
-        return all_hashtags[:10]
+        return list(all_hashtags)[:10]
 
     def schedule_post(self, post_data: Dict[str, Any], scheduled_time: datetime) -> str:
         """Schedule a post for future publication.
@@ -367,27 +463,21 @@ class LinkedInPostGenerator:
         # This would integrate with a scheduling system
         # For now, just return a mock ID
         post_data["scheduled_time"] = scheduled_time.isoformat()
-        return f"scheduled_post_{hash(str(post_data)) % 10000}"
+        payload = json.dumps(post_data, sort_keys=True, default=str).encode()
+        return f"scheduled_post_{hashlib.blake2b(payload, digest_size=8).hexdigest()}"
 
     def get_optimal_posting_times(self) -> List[datetime]:
         """Get optimal times for LinkedIn posting based on engagement data."""
         # Based on research, optimal LinkedIn posting times
-        optimal_times = [
-            # Tuesday-Thursday, 8-10 AM and 12-2 PM are typically best
-            datetime.now().replace(hour=8, minute=0, second=0, microsecond=0),   # Morning
-            datetime.now().replace(hour=12, minute=0, second=0, microsecond=0),  # Lunch
-            datetime.now().replace(hour=17, minute=0, second=0, microsecond=0),  # Evening
-        ]
-
-        # Adjust for day of week
-        import calendar
-        current_weekday = datetime.now().weekday()
+        now = datetime.now()
+        base = now.replace(minute=0, second=0, microsecond=0)
 
         # If weekend, suggest Monday times
-        if current_weekday in [5, 6]:  # Saturday, Sunday
-            optimal_times = [time.replace(day=time.day + (7 - current_weekday)) for time in optimal_times]
+        weekday = now.weekday()
+        days_ahead = 7 - weekday if weekday >= 5 else 0  # Saturday, Sunday
+        delta = timedelta(days=days_ahead)
 
-        return optimal_times
+        return [base.replace(hour=hour) + delta for hour in _OPTIMAL_POSTING_HOURS]
 
 
 # Example usage and testing
@@ -1,10 +1,185 @@
 """LinkedIn Posting Skill - Automate LinkedIn posts about business."""
 
+import asyncio
+import os
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List
-from ..social.linkedin_api import LinkedInAPI, create_post_from_vault_content, get_recent_vault_notes
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List
+from ..social.linkedin_api import (
+    LinkedInAPI,
+    LinkedInAuthError,
+    create_post_from_vault_content,
+    get_recent_vault_notes,
+)
 from ..social.post_scheduler import LinkedInPostScheduler, create_business_content_from_vault, suggest_posting_times
 
+_AUTH_FAILED = MappingProxyType({
+    "success": False,
+    "error": "Authentication failed",
+    "message": "Could not authenticate with LinkedIn",
+})
+
+
+# Failures reported back as result dicts: the client library missing,
+# credentials missing, and network or file errors (requests' exceptions derive
+# from OSError). Anything else is a bug and is allowed to propagate.
+_EXPECTED_ERRORS = (ImportError, ValueError, OSError)
+
+
+def _error_result(error: Exception, message: str) -> Dict[str, Any]:
+    return {"success": False, "error": str(error), "message": message}
+
+
+def _is_rate_limited(error: object) -> bool:
+    text = str(error).lower()
+    return "429" in text or "too many requests" in text or "rate limit" in text
+
+
+def _call_with_backoff(
+    fn: Callable[..., Dict[str, Any]],
+    *args: Any,
+    retries: int = 4,
+    base_delay: float = 0.5,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Call a LinkedInAPI method, retrying rate-limited attempts.
+
+    LinkedInAPI reports failures in its result dict rather than raising, so
+    both raised errors and ``{"success": False, "error": ...}`` results that
+    look like a 429 are retried with capped exponential backoff and jitter.
+    """
+    for attempt in range(retries):
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if not _is_rate_limited(e):
+                raise
+        else:
+            if result.get("success") or not _is_rate_limited(result.get("error", "")):
+                return result
+        time.sleep(min(base_delay * 2 ** attempt, 8.0) + random.uniform(0, base_delay))
+    return fn(*args, **kwargs)
+
+
+# LinkedIn rejects accounts posting more than this many updates per day.
+_MAX_POSTS_PER_DAY = 150
+
+# Bulk schedules tend to reuse the same handful of time slots.
+_parse_iso = lru_cache(maxsize=256)(datetime.fromisoformat)
+
+
+@lru_cache(maxsize=64)
+def _hashtag_suffix(tags: tuple[str, ...]) -> str:
+    return " " + " ".join(f"#{tag}" for tag in tags)
+
+
+# LinkedIn sessions are cookie based and expire server-side; re-login well
+# before that happens rather than discovering it on a failed request.
+_SESSION_TTL_SECONDS = 30 * 60
+
+
+@dataclass(slots=True)
+class _CachedSession:
+    api: LinkedInAPI
+    expires_at: float
+
+
+_MAX_CACHED_SESSIONS = 8
+_sessions: dict[tuple[str | None, str | None], _CachedSession] = {}
+# Sessions are looked up from worker threads (asyncio.to_thread)
+_sessions_lock = threading.Lock()
+
+
+def _login(username: str | None, password: str | None) -> _CachedSession:
+    api = LinkedInAPI(username=username, password=password)
+    if not api.authenticate():
+        # Raising keeps the failed attempt out of the cache.
+        raise LinkedInAuthError("Could not authenticate with LinkedIn")
+    return _CachedSession(api=api, expires_at=time.monotonic() + _SESSION_TTL_SECONDS)
+
+
+def _get_authenticated_api(username: str | None = None, password: str | None = None) -> LinkedInAPI:
+    """Return an authenticated client, reusing a live session for the same credentials."""
+    key = (username, password)
+    with _sessions_lock:
+        session = _sessions.get(key)
+    if session is None or time.monotonic() >= session.expires_at:
+        # Only this credential pair is re-authenticated; other sessions stay
+        # cached. Logging in happens outside the lock.
+        session = _login(username, password)
+        with _sessions_lock:
+            _sessions.pop(key, None)
+            if len(_sessions) >= _MAX_CACHED_SESSIONS:
+                _sessions.pop(next(iter(_sessions)), None)
+            _sessions[key] = session
+    return session.api
+
+
+# suggest_posting_times() depends only on the current date, so its output is
+# kept (already formatted) until the day rolls over.
+_suggested_times_cache: tuple[date, tuple[str, ...]] | None = None
+
+
+# Scanning the vault for post-worthy notes reads every recent file, so results
+# are reused while the Inbox/Needs_Action folders are unchanged. The TTL bounds
+# how long notes can linger past the "recent" window.
+_VAULT_CONTENT_TTL_SECONDS = 300
+_VAULT_CONTENT_FOLDERS = ("Inbox", "Needs_Action")
+_vault_content_cache: dict[tuple[str, str], tuple[float, int, List[Dict[str, Any]]]] = {}
+
+
+def _vault_content_signature(vault_path: str | Path | None) -> int:
+    """Return the newest mtime among the scanned folders and their notes."""
+    root = Path(vault_path) if vault_path is not None else Path(__file__).parent.parent.parent / "vault"
+    newest = 0
+    for folder in _VAULT_CONTENT_FOLDERS:
+        folder_path = root / folder
+        try:
+            newest = max(newest, os.stat(folder_path).st_mtime_ns)
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md"):
+                        newest = max(newest, entry.stat().st_mtime_ns)
+        except FileNotFoundError:
+            continue
+    return newest
+
+
+def _get_business_content(vault_path: str | Path | None, content_type: str) -> List[Dict[str, Any]]:
+    key = (os.fspath(vault_path) if vault_path is not None else "", content_type)
+    signature = _vault_content_signature(vault_path)
+    now = time.monotonic()
+    cached = _vault_content_cache.get(key)
+    if cached is not None and cached[1] == signature:
+        # Time passing can only age notes out of the recent window, so an
+        # empty result stays valid until the folders change.
+        if not cached[2] or now - cached[0] < _VAULT_CONTENT_TTL_SECONDS:
+            return cached[2]
+
+    content_list = create_business_content_from_vault(
+        vault_path=vault_path,
+        content_types=[content_type] if content_type else None
+    )
+    _vault_content_cache[key] = (now, signature, content_list)
+    return content_list
+
+
+def _suggested_times_for_today() -> tuple[str, ...]:
+    global _suggested_times_cache
+    today = date.today()
+    if _suggested_times_cache is None or _suggested_times_cache[0] != today:
+        times = tuple(t.isoformat() for t in suggest_posting_times())
+        _suggested_times_cache = (today, times)
+    return _suggested_times_cache[1]
+
 
 def create_linkedin_post(
     content: str,
@@ -26,32 +201,32 @@ def create_linkedin_post(
         Dictionary with post result
     """
     try:
-        api = LinkedInAPI(username=username, password=password)
-
-        if not api.authenticate():
-            return {
-                "success": False,
-                "error": "Authentication failed",
-                "message": "Could not authenticate with LinkedIn"
-            }
-
-        result = api.post_update(
+        api = _get_authenticated_api(username, password)
+    except LinkedInAuthError:
+        return dict(_AUTH_FAILED)
+    except _EXPECTED_ERRORS as e:
+        return _error_result(e, "Error creating LinkedIn post")
+
+    # Campaigns reuse the same tag set, so the rendered suffix is cached
+    # and the client is spared from re-joining it on every post.
+    if hashtags:
+        content += _hashtag_suffix(tuple(hashtags))
+    try:
+        result = _call_with_backoff(
+            api.post_update,
             text=content,
             visibility=visibility,
-            hashtags=hashtags
         )
+    except OSError as e:
+        return _error_result(e, "Error creating LinkedIn post")
+    if hashtags and result.get("success"):
+        result["hashtags"] = list(hashtags)
 
-        return {
-            "success": result["success"],
-            "post_result": result,
-            "message": "LinkedIn post created successfully" if result["success"] else "Failed to create post"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Error creating LinkedIn post"
-        }
+    return {
+        "success": result["success"],
+        "post_result": result,
+        "message": "LinkedIn post created successfully" if result["success"] else "Failed to create post"
+    }
 
 
 def schedule_linkedin_post(
@@ -76,39 +251,101 @@ def schedule_linkedin_post(
         Dictionary with scheduling result
     """
     try:
-        api = LinkedInAPI(username=username, password=password)
-
-        if not api.authenticate():
-            return {
-                "success": False,
-                "error": "Authentication failed",
-                "message": "Could not authenticate with LinkedIn"
-            }
+        scheduled_datetime = _parse_iso(scheduled_time)
+    except ValueError as e:
+        return _error_result(e, "Error scheduling LinkedIn post")
 
-        from datetime import datetime
-        scheduled_datetime = datetime.fromisoformat(scheduled_time)
+    try:
+        api = _get_authenticated_api(username, password)
+    except LinkedInAuthError:
+        return dict(_AUTH_FAILED)
+    except _EXPECTED_ERRORS as e:
+        return _error_result(e, "Error scheduling LinkedIn post")
 
-        scheduler = LinkedInPostScheduler(linkedin_api=api)
+    scheduler = LinkedInPostScheduler(linkedin_api=api)
 
+    try:
         post_id = scheduler.schedule_post(
             text=content,
             scheduled_time=scheduled_datetime,
             visibility=visibility,
             hashtags=hashtags
         )
+    except (LookupError, OSError) as e:
+        return _error_result(e, "Error scheduling LinkedIn post")
 
-        return {
-            "success": True,
-            "post_id": post_id,
-            "scheduled_time": scheduled_time,
-            "message": f"LinkedIn post scheduled: {post_id}"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Error scheduling LinkedIn post"
-        }
+    return {
+        "success": True,
+        "post_id": post_id,
+        "scheduled_time": scheduled_time,
+        "message": f"LinkedIn post scheduled: {post_id}"
+    }
+
+
+def schedule_linkedin_posts_bulk(
+    items: List[Dict[str, Any]],
+    username: str | None = None,
+    password: str | None = None,
+) -> List[Dict[str, Any]]:
+    """Schedule several LinkedIn posts with one session and scheduler.
+
+    Args:
+        items: Posts to schedule, each with 'content' and 'scheduled_time'
+            (ISO format) and optional 'visibility' and 'hashtags'
+        username: LinkedIn username
+        password: LinkedIn password
+
+    Returns:
+        List of scheduling results, one per item
+    """
+    try:
+        api = _get_authenticated_api(username, password)
+    except LinkedInAuthError:
+        return [dict(_AUTH_FAILED) for _ in items]
+    except _EXPECTED_ERRORS as e:
+        return [_error_result(e, "Error scheduling LinkedIn post") for _ in items]
+
+    scheduler = LinkedInPostScheduler(linkedin_api=api)
+    posts_per_day: Counter = Counter()
+    results = []
+
+    for item in items:
+        scheduled_time = item.get("scheduled_time", "")
+        try:
+            scheduled_datetime = _parse_iso(scheduled_time)
+            day = scheduled_datetime.date()
+            if posts_per_day[day] >= _MAX_POSTS_PER_DAY:
+                results.append({
+                    "success": False,
+                    "error": "Daily post limit reached",
+                    "scheduled_time": scheduled_time,
+                    "message": f"LinkedIn allows at most {_MAX_POSTS_PER_DAY} posts per day"
+                })
+                continue
+
+            post_id = scheduler.schedule_post(
+                text=item["content"],
+                scheduled_time=scheduled_datetime,
+                visibility=item.get("visibility", "PUBLIC"),
+                hashtags=item.get("hashtags")
+            )
+            posts_per_day[day] += 1
+
+            results.append({
+                "success": True,
+                "post_id": post_id,
+                "scheduled_time": scheduled_time,
+                "message": f"LinkedIn post scheduled: {post_id}"
+            })
+        except (LookupError, ValueError, OSError) as e:
+            results.append({
+                "success": False,
+                "error": str(e),
+                "scheduled_time": scheduled_time,
+                "message": "Error scheduling LinkedIn post"
+            })
+
+    return results
 
 
 def create_post_from_vault_content(
@@ -128,10 +365,7 @@ def create_post_from_vault_content(
     """
     try:
         # Get recent business-appropriate content from vault
-        business_content_list = create_business_content_from_vault(
-            vault_path=vault_path,
-            content_types=[content_type] if content_type else None
-        )
+        business_content_list = _get_business_content(vault_path, content_type)
 
         if not business_content_list:
             return {
@@ -145,7 +379,7 @@ def create_post_from_vault_content(
 
         # Use default hashtags if none provided
         if hashtags is None:
-            hashtags = content_item.get("suggested_hashtags", ["Business", "Growth", "Insights"])
+            hashtags = list(content_item.get("suggested_hashtags", ["Business", "Growth", "Insights"]))
 
         return {
             "success": True,
@@ -154,12 +388,8 @@ def create_post_from_vault_content(
             "hashtags": hashtags,
             "message": f"Generated post content from: {content_item['original_note']}"
         }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Error generating post content from vault"
-        }
+    except _EXPECTED_ERRORS as e:
+        return _error_result(e, "Error generating post content from vault")
 
 
 def get_suggested_posting_times(
@@ -173,23 +403,16 @@ def get_suggested_posting_times(
     Returns:
         Dictionary with suggested posting times
     """
-    try:
-        suggested_times = suggest_posting_times()
+    suggested_times = _suggested_times_for_today()
 
-        # Return the first 'count' suggestions
-        times_to_return = suggested_times[:count]
+    # Return the first 'count' suggestions
+    times_to_return = list(islice(suggested_times, max(count, 0)))
 
-        return {
-            "success": True,
-            "suggested_times": [time.isoformat() for time in times_to_return],
-            "message": f"Suggested {len(times_to_return)} optimal posting times"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Error getting suggested posting times"
-        }
+    return {
+        "success": True,
+        "suggested_times": times_to_return,
+        "message": f"Suggested {len(times_to_return)} optimal posting times"
+    }
 
 
 def get_linkedin_profile_info(
@@ -206,28 +429,18 @@ def get_linkedin_profile_info(
         Dictionary with profile information
     """
     try:
-        api = LinkedInAPI(username=username, password=password)
-
-        if not api.authenticate():
-            return {
-                "success": False,
-                "error": "Authentication failed",
-                "message": "Could not authenticate with LinkedIn"
-            }
+        api = _get_authenticated_api(username, password)
+        profile_info = _call_with_backoff(api.get_profile_info)
+    except LinkedInAuthError:
+        return dict(_AUTH_FAILED)
+    except _EXPECTED_ERRORS as e:
+        return _error_result(e, "Error retrieving LinkedIn profile info")
 
-        profile_info = api.get_profile_info()
-
-        return {
-            "success": profile_info["success"],
-            "profile_info": profile_info,
-            "message": "Retrieved LinkedIn profile info" if profile_info["success"] else "Failed to retrieve profile info"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Error retrieving LinkedIn profile info"
-        }
+    return {
+        "success": profile_info["success"],
+        "profile_info": profile_info,
+        "message": "Retrieved LinkedIn profile info" if profile_info["success"] else "Failed to retrieve profile info"
+    }
 
 
 def get_linkedin_network_info(
@@ -244,25 +457,64 @@ def get_linkedin_network_info(
         Dictionary with network information
     """
     try:
-        api = LinkedInAPI(username=username, password=password)
+        api = _get_authenticated_api(username, password)
+        network_info = _call_with_backoff(api.get_network_info)
+    except LinkedInAuthError:
+        return dict(_AUTH_FAILED)
+    except _EXPECTED_ERRORS as e:
+        return _error_result(e, "Error retrieving LinkedIn network info")
 
-        if not api.authenticate():
-            return {
-                "success": False,
-                "error": "Authentication failed",
-                "message": "Could not authenticate with LinkedIn"
-            }
+    return {
+        "success": network_info["success"],
+        "network_info": network_info,
+        "message": "Retrieved LinkedIn network info" if network_info["success"] else "Failed to retrieve network info"
+    }
 
-        network_info = api.get_network_info()
 
-        return {
-            "success": network_info["success"],
-            "network_info": network_info,
-            "message": "Retrieved LinkedIn network info" if network_info["success"] else "Failed to retrieve network info"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Error retrieving LinkedIn network info"
-        }
\ No newline at end of file
+async def _aget_profile_info(api: LinkedInAPI) -> Dict[str, Any]:
+    return await asyncio.to_thread(_call_with_backoff, api.get_profile_info)
+
+
+async def _aget_network_info(api: LinkedInAPI) -> Dict[str, Any]:
+    return await asyncio.to_thread(_call_with_backoff, api.get_network_info)
+
+
+async def get_linkedin_account_snapshot(
+    username: str | None = None,
+    password: str | None = None,
+) -> Dict[str, Any]:
+    """Get LinkedIn profile and network information in one call.
+
+    Both endpoints are independent, so they are requested concurrently.
+
+    Args:
+        username: LinkedIn username
+        password: LinkedIn password
+
+    Returns:
+        Dictionary with profile and network information
+    """
+    try:
+        api = await asyncio.to_thread(_get_authenticated_api, username, password)
+    except LinkedInAuthError:
+        return dict(_AUTH_FAILED)
+    except _EXPECTED_ERRORS as e:
+        return _error_result(e, "Error retrieving LinkedIn account snapshot")
+
+    profile_info, network_info = await asyncio.gather(
+        _aget_profile_info(api),
+        _aget_network_info(api),
+        return_exceptions=True,
+    )
+    if isinstance(profile_info, BaseException):
+        profile_info = {"success": False, "error": str(profile_info)}
+    if isinstance(network_info, BaseException):
+        network_info = {"success": False, "error": str(network_info)}
+
+    success = profile_info["success"] and network_info["success"]
+    return {
+        "success": success,
+        "profile_info": profile_info,
+        "network_info": network_info,
+        "message": "Retrieved LinkedIn account snapshot" if success else "Failed to retrieve part of the account snapshot"
+    }
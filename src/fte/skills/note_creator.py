@@ -1,8 +1,61 @@
 """Note Creator Skill - Create structured notes in the vault."""
 
+import os
 from pathlib import Path
-from datetime import datetime
-from ..vault_manager import VaultManager
+from datetime import date, datetime
+from ..vault_manager import get_vault_manager
+
+_VALID_FOLDERS = frozenset(("Inbox", "Needs_Action", "Done"))
+_INVALID_FOLDER_ERROR = "Invalid folder. Use one of: ['Inbox', 'Needs_Action', 'Done']"
+
+# Vaults whose dashboard is stale because notes were created with
+# update_dashboard=False; cleared by flush_dashboard().
+_dirty_dashboards: set[Path] = set()
+
+_PRIORITY_TAGS: dict[str, tuple[str, ...]] = {
+    "urgent": ("task", "urgent"),
+    "high": ("task", "important"),
+    "normal": ("task",),
+    "low": ("task",),
+}
+_DEFAULT_TASK_TAGS = ("task",)
+
+_today_cache: tuple[date, str] | None = None
+
+
+def _today_str() -> str:
+    """Return today's date as YYYY-MM-DD, formatting it once per day."""
+    global _today_cache
+    today = date.today()
+    if _today_cache is None or _today_cache[0] != today:
+        _today_cache = (today, today.strftime('%Y-%m-%d'))
+    return _today_cache[1]
+
+
+_TASK_TEMPLATE = """{description}
+
+## Details
+- **Priority:** {priority}
+- **Created:** {created}{due_line}
+
+## Checklist
+- [ ] Task item 1
+- [ ] Task item 2
+
+## Notes
+_Add notes here_"""
+
+_MEETING_TEMPLATE = """**Date:** {date}
+
+{attendees_block}{agenda_block}## Discussion Notes
+_Notes from the meeting_
+
+## Action Items
+- [ ] Action item 1
+- [ ] Action item 2
+
+## Follow-up
+_Next steps and follow-up items_"""
 
 
 def create_note(
@@ -11,6 +64,7 @@ def create_note(
     folder: str = "Inbox",
     tags: list[str] | None = None,
     vault_path: str | Path | None = None,
+    update_dashboard: bool = True,
 ) -> dict:
     """Create a new note in the vault.
 
@@ -20,35 +74,80 @@ def create_note(
         folder: Target folder (default: Inbox)
         tags: Optional list of tags
         vault_path: Optional path to vault directory
+        update_dashboard: Refresh the dashboard now; pass False when creating
+            many notes and call flush_dashboard() afterwards
 
     Returns:
         Result dictionary with created note path
     """
-    manager = VaultManager(vault_path)
-
     # Validate folder
-    valid_folders = ["Inbox", "Needs_Action", "Done"]
-    if folder not in valid_folders:
+    if folder not in _VALID_FOLDERS:
         return {
             "success": False,
-            "error": f"Invalid folder. Use one of: {valid_folders}",
+            "error": _INVALID_FOLDER_ERROR,
         }
 
+    manager = get_vault_manager(vault_path)
+
     # Create the note
     note_path = manager.create_note(title, content, folder, tags)
 
     # Update dashboard
-    manager.update_dashboard()
+    if update_dashboard:
+        manager.update_dashboard()
+        _dirty_dashboards.discard(manager.vault_path)
+    else:
+        _dirty_dashboards.add(manager.vault_path)
 
     return {
         "success": True,
         "message": f"Created note: {title}",
-        "path": str(note_path),
+        "path": os.fspath(note_path),
         "folder": folder,
         "tags": tags or [],
     }
 
 
+def flush_dashboard(vault_path: str | Path | None = None) -> bool:
+    """Refresh the dashboard if notes were created without updating it.
+
+    Args:
+        vault_path: Optional path to vault directory
+
+    Returns:
+        True if the dashboard was refreshed
+    """
+    manager = get_vault_manager(vault_path)
+    if manager.vault_path not in _dirty_dashboards:
+        return False
+    manager.update_dashboard()
+    _dirty_dashboards.discard(manager.vault_path)
+    return True
+
+
+def create_notes_batch(
+    items: list[dict],
+    vault_path: str | Path | None = None,
+) -> list[dict]:
+    """Create several notes, refreshing the dashboard once at the end.
+
+    Args:
+        items: Keyword arguments for create_note (title, content, folder, tags)
+        vault_path: Optional path to vault directory
+
+    Returns:
+        List of result dictionaries, one per item
+    """
+    if vault_path is not None:
+        vault_path = Path(vault_path)
+    results = [
+        create_note(**item, vault_path=vault_path, update_dashboard=False)
+        for item in items
+    ]
+    flush_dashboard(vault_path)
+    return results
+
+
 def create_task_note(
     title: str,
     description: str,
@@ -68,36 +167,16 @@ def create_task_note(
     Returns:
         Result dictionary
     """
-    # Build task content
-    lines = [
-        description,
-        "",
-        "## Details",
-        f"- **Priority:** {priority}",
-        f"- **Created:** {datetime.now().strftime('%Y-%m-%d')}",
-    ]
-
-    if due_date:
-        lines.append(f"- **Due:** {due_date}")
-
-    lines.extend([
-        "",
-        "## Checklist",
-        "- [ ] Task item 1",
-        "- [ ] Task item 2",
-        "",
-        "## Notes",
-        "_Add notes here_",
-    ])
-
-    content = "\n".join(lines)
+    due_line = f"\n- **Due:** {due_date}" if due_date else ""
+    content = _TASK_TEMPLATE.format(
+        description=description,
+        priority=priority,
+        created=_today_str(),
+        due_line=due_line,
+    )
 
     # Set tags based on priority
-    tags = ["task"]
-    if priority == "urgent":
-        tags.append("urgent")
-    elif priority == "high":
-        tags.append("important")
+    tags = list(_PRIORITY_TAGS.get(priority, _DEFAULT_TASK_TAGS))
 
     return create_note(
         title=title,
@@ -125,36 +204,19 @@ def create_meeting_note(
     Returns:
         Result dictionary
     """
-    lines = [
-        f"**Date:** {datetime.now().strftime('%Y-%m-%d')}",
-        "",
-    ]
-
+    attendees_block = ""
     if attendees:
-        lines.append("## Attendees")
-        for person in attendees:
-            lines.append(f"- {person}")
-        lines.append("")
+        attendees_block = "## Attendees\n" + "".join(f"- {person}\n" for person in attendees) + "\n"
 
+    agenda_block = ""
     if agenda:
-        lines.append("## Agenda")
-        for item in agenda:
-            lines.append(f"1. {item}")
-        lines.append("")
-
-    lines.extend([
-        "## Discussion Notes",
-        "_Notes from the meeting_",
-        "",
-        "## Action Items",
-        "- [ ] Action item 1",
-        "- [ ] Action item 2",
-        "",
-        "## Follow-up",
-        "_Next steps and follow-up items_",
-    ])
-
-    content = "\n".join(lines)
+        agenda_block = "## Agenda\n" + "".join(f"1. {item}\n" for item in agenda) + "\n"
+
+    content = _MEETING_TEMPLATE.format(
+        date=_today_str(),
+        attendees_block=attendees_block,
+        agenda_block=agenda_block,
+    )
 
     return create_note(
         title=title,
@@ -183,10 +245,11 @@ def quick_capture(
     title = f"Quick Note {timestamp}"
 
     # Use first line as title if it looks like a title
-    first_line = text.split("\n")[0].strip()
+    head, _, rest = text.partition("\n")
+    first_line = head.strip()
     if len(first_line) < 60 and not first_line.startswith("-"):
         title = first_line
-        text = "\n".join(text.split("\n")[1:]).strip()
+        text = rest.strip()
 
     return create_note(
         title=title,
@@ -4,10 +4,367 @@ with timeline, resources, and success metrics.
 """
 import json
 import os
+import re
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import combinations
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from ..vault_manager import VaultManager
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Sequence
+from ..vault_manager import get_vault_manager
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Keyword vocabularies for analyze_business_objective. Goal and timeline words
+# are matched against whole tokens; constraints are reported in this order.
+_GOAL_WORDS = frozenset((
+    "increase", "grow", "expand", "launch", "develop", "improve",
+    "reduce", "optimize", "enhance", "establish", "build", "create"
+))
+_TIMELINE_WORDS = frozenset((
+    "by", "within", "in", "next", "over the next", "until", "before"
+))
+_CONSTRAINT_WORDS = (
+    "limited", "small", "tight", "constrained", "minimal",
+    "budget", "low", "restricted", "few", "short"
+)
+_CONSTRAINT_SET = frozenset(_CONSTRAINT_WORDS)
+# Metrics and stakeholders are matched as substrings of the objective.
+_METRIC_TERMS = (
+    "revenue", "profit", "sales", "customers", "users",
+    "engagement", "conversion", "growth", "roi", "efficiency"
+)
+_STAKEHOLDER_TERMS = (
+    "team", "department", "client", "customer", "partner",
+    "vendor", "supplier", "manager", "employee"
+)
+# Markers of lessons learned and performance data in historical vault notes.
+_LESSON_RE = re.compile(r"lesson|learned|mistake", re.IGNORECASE)
+_PERFORMANCE_RE = re.compile(r"performance|result|metric", re.IGNORECASE)
+
+# Plan types in priority order with the substrings that select them.
+_PLAN_TYPE_KEYWORDS = (
+    ("product_launch", ("launch", "product", "market entry", "new offering", "go-to-market")),
+    ("marketing_campaign", ("marketing", "campaign", "promote", "awareness", "brand", "social media")),
+    ("process_improvement", ("process", "efficiency", "optimization", "workflow", "improvement", "streamline")),
+)
+_OBJECTIVE_TERMS = tuple(dict.fromkeys(
+    [keyword for _, keywords in _PLAN_TYPE_KEYWORDS for keyword in keywords]
+    + list(_METRIC_TERMS) + list(_STAKEHOLDER_TERMS)
+))
+
+
+# Resource-estimation trigger substrings and the category tag each one sets.
+_RESOURCE_TRIGGERS = MappingProxyType({
+    "complex": "complex", "advanced": "complex", "sophisticated": "complex",
+    "simple": "simple", "basic": "simple", "routine": "simple",
+    "team": "team", "collaboration": "team",
+    "individual": "individual", "personal": "individual",
+    "physical": "physical", "hardware": "physical",
+    "digital": "digital", "online": "digital", "web": "web",
+    "marketing": "marketing", "promotion": "marketing",
+    "development": "development", "building": "development",
+    "ai": "data", "machine learning": "data", "data": "data",
+})
+
+
+# Tags that select specific software, material items and roles.
+_NEED_TAGS = frozenset(("digital", "web", "marketing", "development"))
+
+
+def _resource_needs(tags: frozenset) -> tuple:
+    """Return the (software, items, roles) an objective with these tags needs.
+
+    Later rules take precedence: development over marketing over digital.
+    """
+    software = items = roles = ()
+    if "digital" in tags or "web" in tags:
+        software = ("Project management software", "Design tools", "Analytics platform")
+        items = ("Digital infrastructure", "Online marketing materials")
+    if "marketing" in tags:
+        roles = ("Marketing Specialist", "Content Creator", "Analyst")
+        items = ("Marketing materials", "Campaign assets", "Promotional items")
+    if "development" in tags:
+        roles = ("Developer", "Designer", "QA Engineer")
+        items = ("Development tools", "Testing environments", "Documentation systems")
+    return software, items, roles
+
+
+# Needs for every combination of need tags, so estimates do one lookup.
+_RESOURCE_NEEDS = MappingProxyType({
+    frozenset(combo): _resource_needs(frozenset(combo))
+    for size in range(len(_NEED_TAGS) + 1)
+    for combo in combinations(sorted(_NEED_TAGS), size)
+})
+
+
+def _build_term_automaton(tags):
+    """Build an Aho-Corasick automaton that yields the tag of each matched term."""
+    automaton = ahocorasick.Automaton()
+    for term, tag in tags.items():
+        automaton.add_word(term, tag)
+    automaton.make_automaton()
+    return automaton
+
+
+if AHOCORASICK_AVAILABLE:
+    _OBJECTIVE_AC = _build_term_automaton({term: term for term in _OBJECTIVE_TERMS})
+    _RESOURCE_AC = _build_term_automaton(_RESOURCE_TRIGGERS)
+else:
+    _OBJECTIVE_AC = _RESOURCE_AC = None
+
+
+def _resource_tags(objective_lower: str) -> frozenset:
+    """Return the resource category tags whose trigger words occur in the objective."""
+    if _RESOURCE_AC is not None:
+        return frozenset(tag for _, tag in _RESOURCE_AC.iter(objective_lower))
+    # Plain substring tests beat a combined regex here: the triggers are few and
+    # objectives short, and str.__contains__ already uses a vectorized search.
+    return frozenset(tag for term, tag in _RESOURCE_TRIGGERS.items() if term in objective_lower)
+
+# Without pyahocorasick, classify with one compiled regex: each optional
+# lookahead records whether its plan type's keywords occur anywhere, and the
+# first group set (in priority order) wins.
+_PLAN_TYPE_RE = re.compile("(?s)" + "".join(
+    f"(?=.*?(?P<{name}>{'|'.join(map(re.escape, keywords))}))?"
+    for name, keywords in _PLAN_TYPE_KEYWORDS
+))
+_DETAIL_TERMS = _METRIC_TERMS + _STAKEHOLDER_TERMS
+
+
+@lru_cache(maxsize=512)
+def _classify_objective(objective_lower: str) -> tuple:
+    """Return the plan type and the metric/stakeholder terms found in the objective.
+
+    Pure in the lower-cased objective, so results are memoized and shared by
+    every generator; the matched terms come back as a frozenset.
+    """
+    if _OBJECTIVE_AC is not None:
+        matched = frozenset(term for _, term in _OBJECTIVE_AC.iter(objective_lower))
+        plan_type = next(
+            (name for name, keywords in _PLAN_TYPE_KEYWORDS if not matched.isdisjoint(keywords)),
+            "business_development"
+        )
+        return plan_type, matched
+
+    groups = _PLAN_TYPE_RE.match(objective_lower).groupdict()
+    plan_type = next(
+        (name for name, _ in _PLAN_TYPE_KEYWORDS if groups[name] is not None),
+        "business_development"
+    )
+    return plan_type, frozenset(term for term in _DETAIL_TERMS if term in objective_lower)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+# Plan templates are immutable and shared by every generator instance.
+_PLAN_TEMPLATES = MappingProxyType({
+    "business_development": MappingProxyType({
+        "title": "Business Development Plan",
+        "sections": (
+            "Executive Summary",
+            "Objectives & Goals",
+            "Market Analysis",
+            "Target Audience",
+            "Strategies & Tactics",
+            "Timeline",
+            "Resources Needed",
+            "Budget",
+            "Success Metrics",
+            "Risk Assessment",
+            "Action Items"
+        ),
+        "duration_options": ("30 days", "60 days", "90 days", "6 months", "1 year")
+    }),
+    "product_launch": MappingProxyType({
+        "title": "Product Launch Plan",
+        "sections": (
+            "Product Overview",
+            "Market Opportunity",
+            "Launch Objectives",
+            "Target Market",
+            "Marketing Strategy",
+            "Sales Strategy",
+            "Timeline",
+            "Resource Allocation",
+            "Budget",
+            "Success Metrics",
+            "Risk Management",
+            "Post-Launch Activities"
+        ),
+        "duration_options": ("45 days", "60 days", "90 days", "120 days")
+    }),
+    "marketing_campaign": MappingProxyType({
+        "title": "Marketing Campaign Plan",
+        "sections": (
+            "Campaign Overview",
+            "Target Audience",
+            "Key Messages",
+            "Channel Strategy",
+            "Content Calendar",
+            "Timeline",
+            "Budget",
+            "Success Metrics",
+            "Competitive Analysis",
+            "Adjustment Protocols"
+        ),
+        "duration_options": ("30 days", "45 days", "60 days", "90 days")
+    }),
+    "process_improvement": MappingProxyType({
+        "title": "Process Improvement Plan",
+        "sections": (
+            "Current State Analysis",
+            "Improvement Objectives",
+            "Proposed Solutions",
+            "Implementation Steps",
+            "Timeline",
+            "Resources Required",
+            "Cost-Benefit Analysis",
+            "Success Metrics",
+            "Change Management",
+            "Monitoring Plan"
+        ),
+        "duration_options": ("30 days", "60 days", "90 days", "6 months")
+    })
+})
+
+# Title-cased forms of the fixed vocabulary rendered into plans: metric terms,
+# resource categories and their fields.
+_TITLES = {
+    word: word.title()
+    for word in _METRIC_TERMS + (
+        "personnel", "materials", "tools",
+        "roles", "items", "software", "estimation_basis", "cost",
+    )
+}
+_PLAN_TYPE_TITLES = {name: name.replace("_", " ").title() for name in _PLAN_TEMPLATES}
+
+
+def _titled(word: str) -> str:
+    title = _TITLES.get(word)
+    return title if title is not None else word.title()
+
+
+# Fixed section bodies; only the objectives and strategies take the objective.
+_OBJECTIVES_TEMPLATE = """Primary Objective: {objective}
+
+Supporting Goals:
+- Goal 1: Define specific, measurable outcome
+- Goal 2: Establish clear timeline
+- Goal 3: Identify success metrics
+- Goal 4: Allocate necessary resources"""
+
+_STRATEGIES_TEMPLATE = """To achieve {objective}, we will employ the following strategies:
+
+1. Strategy One: Description of the first approach
+   - Tactic 1a: Specific action
+   - Tactic 1b: Specific action
+
+2. Strategy Two: Description of the second approach
+   - Tactic 2a: Specific action
+   - Tactic 2b: Specific action
+
+3. Strategy Three: Description of the third approach
+   - Tactic 3a: Specific action
+   - Tactic 3b: Specific action"""
+
+_TIMELINE_OVERVIEW = """Phase 1: Planning and Preparation (Weeks 1-2)
+  - Define requirements
+  - Assemble team
+  - Set up infrastructure
+
+Phase 2: Implementation (Weeks 3-6)
+  - Execute primary activities
+  - Monitor progress
+  - Make adjustments
+
+Phase 3: Evaluation and Optimization (Weeks 7-8)
+  - Assess outcomes
+  - Document learnings
+  - Plan next steps"""
+
+_RESOURCE_SECTION = """Human Resources:
+  - Project Manager: 1 FTE
+  - Subject Matter Experts: 2-3 part-time
+  - Support Staff: As needed
+
+Material Resources:
+  - Software licenses
+  - Equipment
+  - Infrastructure
+
+Financial Resources:
+  - Personnel costs
+  - Operational expenses
+  - Contingency fund"""
+
+_RISK_SECTION = """High Priority Risks:
+  - Resource availability
+  - Timeline constraints
+  - External dependencies
+
+Medium Priority Risks:
+  - Scope creep
+  - Stakeholder alignment
+  - Technology limitations
+
+Mitigation Strategies:
+  - Regular monitoring and reporting
+  - Clear communication protocols
+  - Contingency planning"""
+
+_ACTION_ITEMS_SECTION = """Immediate Actions (Week 1):
+  [ ] Define project scope and requirements
+  [ ] Identify and assemble project team
+  [ ] Establish communication channels
+  [ ] Set up project tracking tools
+
+Short-term Actions (Weeks 2-4):
+  [ ] Begin implementation activities
+  [ ] Conduct regular progress reviews
+  [ ] Address initial challenges
+
+Ongoing Actions:
+  [ ] Monitor KPIs and metrics
+  [ ] Communicate progress to stakeholders
+  [ ] Adapt approach based on feedback"""
+
+# Length of each duration unit in days (months and years are approximate).
+_DAYS_PER_UNIT = {"day": 1, "week": 7, "month": 30, "year": 365}
+
+# Objectives are often re-planned with a different plan type or duration;
+# keep this many analyses/estimates around per generator.
+_ANALYSIS_CACHE_SIZE = 256
+
+# Historical context: recent notes sharing a word of this length or longer
+# with the objective count as related, newest first
+_HISTORY_LIMIT = 5
+_HISTORY_MIN_WORD_LENGTH = 4
+_HISTORY_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Placeholder analysis for plans whose type was chosen by the caller.
+_NO_ANALYSIS = MappingProxyType({"key_elements": MappingProxyType({}), "historical_context": MappingProxyType({})})
+# Section generators whose output depends on the objective text.
+_OBJECTIVE_SECTIONS = frozenset(("_generate_executive_summary", "_generate_objectives", "_generate_strategies"))
+
+# Section-name keywords (checked in order) and the generator for each.
+_SECTION_HANDLERS = (
+    (("executive", "overview"), "_generate_executive_summary"),
+    (("objective", "goal"), "_generate_objectives"),
+    (("strategy", "tactic"), "_generate_strategies"),
+    (("timeline",), "_generate_timeline_overview"),
+    (("resource", "budget"), "_generate_resource_section"),
+    (("metric", "success"), "_generate_metrics_section"),
+    (("risk",), "_generate_risk_section"),
+    (("action", "item"), "_generate_action_items_section"),
+)
 
 
 class PlanGenerator:
@@ -19,81 +376,21 @@ class PlanGenerator:
         Args:
             vault_path: Path to the vault directory for historical context
         """
-        self.vault_manager = VaultManager(vault_path)
+        self.vault_manager = get_vault_manager(vault_path)
         self.plan_templates = self._load_plan_templates()
-        self.resource_estimator = ResourceEstimator()
+        self.resource_estimator = _RESOURCE_ESTIMATOR
+        self._analysis_cache: Dict[str, Dict[str, Any]] = {}
+        self._static_sections: Dict[str, Dict[str, Optional[str]]] = {}
+        # Section names are fixed per template, so resolve their generators once
+        self._section_dispatch = {
+            section_name: self._resolve_section_handler(section_name)
+            for template in self.plan_templates.values()
+            for section_name in template["sections"]
+        }
 
     def _load_plan_templates(self) -> Dict[str, Any]:
         """Load different plan templates for various business objectives."""
-        return {
-            "business_development": {
-                "title": "Business Development Plan",
-                "sections": [
-                    "Executive Summary",
-                    "Objectives & Goals",
-                    "Market Analysis",
-                    "Target Audience",
-                    "Strategies & Tactics",
-                    "Timeline",
-                    "Resources Needed",
-                    "Budget",
-                    "Success Metrics",
-                    "Risk Assessment",
-                    "Action Items"
-                ],
-                "duration_options": ["30 days", "60 days", "90 days", "6 months", "1 year"]
-            },
-            "product_launch": {
-                "title": "Product Launch Plan",
-                "sections": [
-                    "Product Overview",
-                    "Market Opportunity",
-                    "Launch Objectives",
-                    "Target Market",
-                    "Marketing Strategy",
-                    "Sales Strategy",
-                    "Timeline",
-                    "Resource Allocation",
-                    "Budget",
-                    "Success Metrics",
-                    "Risk Management",
-                    "Post-Launch Activities"
-                ],
-                "duration_options": ["45 days", "60 days", "90 days", "120 days"]
-            },
-            "marketing_campaign": {
-                "title": "Marketing Campaign Plan",
-                "sections": [
-                    "Campaign Overview",
-                    "Target Audience",
-                    "Key Messages",
-                    "Channel Strategy",
-                    "Content Calendar",
-                    "Timeline",
-                    "Budget",
-                    "Success Metrics",
-                    "Competitive Analysis",
-                    "Adjustment Protocols"
-                ],
-                "duration_options": ["30 days", "45 days", "60 days", "90 days"]
-            },
-            "process_improvement": {
-                "title": "Process Improvement Plan",
-                "sections": [
-                    "Current State Analysis",
-                    "Improvement Objectives",
-                    "Proposed Solutions",
-                    "Implementation Steps",
-                    "Timeline",
-                    "Resources Required",
-                    "Cost-Benefit Analysis",
-                    "Success Metrics",
-                    "Change Management",
-                    "Monitoring Plan"
-                ],
-                "duration_options": ["30 days", "60 days", "90 days", "6 months"]
-            }
-        }
+        return _PLAN_TEMPLATES
 
     def analyze_business_objective(self, objective: str) -> Dict[str, Any]:
         """Analyze a business objective to determine the best plan type.
@@ -102,123 +399,85 @@ class PlanGenerator:
             objective: Description of the business objective
 
         Returns:
-            Analysis including plan type recommendation
+            Analysis including plan type recommendation. Results are cached
+            per objective and shared between calls, so treat them as read-only.
         """
+        cached = self._analysis_cache.get(objective)
+        if cached is not None:
+            return cached
+
         objective_lower = objective.lower()
 
-        # Determine plan type based on keywords
-        if any(keyword in objective_lower for keyword in [
-            "launch", "product", "market entry", "new offering", "go-to-market"
-        ]):
-            plan_type = "product_launch"
-        elif any(keyword in objective_lower for keyword in [
-            "marketing", "campaign", "promote", "awareness", "brand", "social media"
-        ]):
-            plan_type = "marketing_campaign"
-        elif any(keyword in objective_lower for keyword in [
-            "process", "efficiency", "optimization", "workflow", "improvement", "streamline"
-        ]):
-            plan_type = "process_improvement"
-        else:
-            # Default to business development for general objectives
-            plan_type = "business_development"
+        # Determine plan type based on keywords, defaulting to business
+        # development for general objectives
+        plan_type, matched = _classify_objective(objective_lower)
 
         # Extract key elements from objective
+        words = objective_lower.split()
         elements = {
-            "primary_goal": self._extract_primary_goal(objective),
-            "timeline_requirement": self._extract_timeline_requirement(objective),
-            "resource_constraints": self._extract_resource_constraints(objective),
-            "success_metrics": self._extract_success_metrics(objective),
-            "stakeholders": self._extract_stakeholders(objective)
+            "primary_goal": self._extract_primary_goal(objective, words),
+            "timeline_requirement": self._extract_timeline_requirement(words),
+            "resource_constraints": self._extract_resource_constraints(words),
+            "success_metrics": self._extract_success_metrics(matched),
+            "stakeholders": self._extract_stakeholders(matched)
         }
 
-        return {
+        analysis = {
             "recommended_plan_type": plan_type,
             "confidence": 0.8,  # High confidence based on keyword matching
             "key_elements": elements,
             "historical_context": self._get_historical_context(objective)
         }
 
-    def _extract_primary_goal(self, objective: str) -> str:
+        if len(self._analysis_cache) >= _ANALYSIS_CACHE_SIZE:
+            # Evict the oldest entry; dicts preserve insertion order
+            del self._analysis_cache[next(iter(self._analysis_cache))]
+        self._analysis_cache[objective] = analysis
+        return analysis
+
+    def _extract_primary_goal(self, objective: str, words: List[str]) -> str:
         """Extract the primary goal from the objective."""
         # Look for goal-indicating phrases
-        goal_patterns = [
-            "increase", "grow", "expand", "launch", "develop", "improve",
-            "reduce", "optimize", "enhance", "establish", "build", "create"
-        ]
-
-        words = objective.lower().split()
         for i, word in enumerate(words):
-            if word in goal_patterns and i + 1 < len(words):
+            if word in _GOAL_WORDS and i + 1 < len(words):
                 # Return the goal phrase (verb + object)
                 return f"{word} {words[i+1]}"
 
-        return objective[:50] + "..." if len(objective) > 50 else objective
+        return _truncate(objective, 50)
 
-    def _extract_timeline_requirement(self, objective: str) -> Optional[str]:
+    def _extract_timeline_requirement(self, words: List[str]) -> Optional[str]:
         """Extract timeline requirements from the objective."""
-        timeline_patterns = [
-            "by", "within", "in", "next", "over the next", "until", "before"
-        ]
-
-        words = objective.lower().split()
         for i, word in enumerate(words):
-            if word in timeline_patterns and i + 1 < len(words):
+            if word in _TIMELINE_WORDS and i + 1 < len(words):
                 # Return the next 2-3 words as the timeline
                 end_idx = min(i + 3, len(words))
                 return " ".join(words[i:end_idx])
 
         return None
 
-    def _extract_resource_constraints(self, objective: str) -> List[str]:
+    def _extract_resource_constraints(self, words: List[str]) -> List[str]:
         """Extract resource constraints from the objective."""
-        constraint_patterns = [
-            "limited", "small", "tight", "constrained", "minimal",
-            "budget", "low", "restricted", "few", "short"
-        ]
+        found = _CONSTRAINT_SET.intersection(words)
+        if not found:
+            return []
+        # Report in vocabulary order so the result is deterministic
+        return [word for word in _CONSTRAINT_WORDS if word in found]
 
-        constraints = []
-        words = objective.lower().split()
-        for word in constraint_patterns:
-            if word in words:
-                constraints.append(word)
+    def _extract_success_metrics(self, matched: frozenset) -> List[str]:
+        """Extract potential success metrics from the matched objective terms."""
+        return [pattern for pattern in _METRIC_TERMS if pattern in matched]
 
-        return constraints
-
-    def _extract_success_metrics(self, objective: str) -> List[str]:
-        """Extract potential success metrics from the objective."""
-        metric_patterns = [
-            "revenue", "profit", "sales", "customers", "users",
-            "engagement", "conversion", "growth", "roi", "efficiency"
-        ]
-
-        metrics = []
-        objective_lower = objective.lower()
-        for pattern in metric_patterns:
-            if pattern in objective_lower:
-                metrics.append(pattern)
-
-        return metrics
-
-    def _extract_stakeholders(self, objective: str) -> List[str]:
-        """Extract stakeholders from the objective."""
-        stakeholder_patterns = [
-            "team", "department", "client", "customer", "partner",
-            "vendor", "supplier", "manager", "employee"
-        ]
-
-        stakeholders = []
-        objective_lower = objective.lower()
-        for pattern in stakeholder_patterns:
-            if pattern in objective_lower:
-                stakeholders.append(pattern)
-
-        return stakeholders
+    def _extract_stakeholders(self, matched: frozenset) -> List[str]:
+        """Extract stakeholders from the matched objective terms."""
+        return [pattern for pattern in _STAKEHOLDER_TERMS if pattern in matched]
 
     def _get_historical_context(self, objective: str) -> Dict[str, Any]:
         """Get historical context from the vault for similar objectives."""
-        # Search vault for similar objectives or related content
-        related_content = self.vault_manager.search_content(objective, limit=5)
+        try:
+            related_content = self._find_related_content(objective)
+        except OSError as e:
+            print(f"Error reading vault for historical context: {e}")
+            related_content = []
 
         return {
             "similar_past_projects": len(related_content),
@@ -226,25 +485,44 @@ class PlanGenerator:
             "past_performance_data": self._extract_performance_data(related_content)
         }
 
+    def _find_related_content(self, objective: str) -> List[Dict[str, Any]]:
+        """Find recent vault notes that mention a significant word of the objective."""
+        terms = {
+            word for word in _HISTORY_WORD_RE.findall(objective.lower())
+            if len(word) >= _HISTORY_MIN_WORD_LENGTH
+        }
+        if not terms:
+            return []
+
+        related = []
+        for item in self.vault_manager.get_recent_content():
+            if terms.intersection(_HISTORY_WORD_RE.findall(item["content"].lower())):
+                related.append(item)
+                if len(related) == _HISTORY_LIMIT:
+                    break
+        return related
+
     def _extract_lessons(self, content_list: List[Dict[str, Any]]) -> List[str]:
         """Extract lessons learned from historical content."""
         lessons = []
         for content in content_list:
             text = content.get('content', '')
-            if 'lesson' in text.lower() or 'learned' in text.lower() or 'mistake' in text.lower():
-                lessons.append(text[:100] + "..." if len(text) > 100 else text)
+            if _LESSON_RE.search(text):
+                lessons.append(_truncate(text, 100))
+                if len(lessons) == 3:  # Limit to top 3 lessons
+                    break
 
-        return lessons[:3]  # Limit to top 3 lessons
+        return lessons
 
     def _extract_performance_data(self, content_list: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Extract performance data from historical content."""
         performance_data = {}
 
         for content in content_list:
-            text = content.get('content', '').lower()
+            text = content.get('content', '')
             # Look for performance indicators
-            if 'performance' in text or 'result' in text or 'metric' in text:
-                performance_data[content.get('title', 'Unknown')] = text
+            if _PERFORMANCE_RE.search(text):
+                performance_data[content.get('title', 'Unknown')] = text.lower()
 
         return performance_data
 
@@ -271,35 +549,47 @@ class PlanGenerator:
 
         template = self.plan_templates[plan_type]
 
+        if analysis["key_elements"]:
+            sections = self._generate_sections(template["sections"], objective, analysis)
+        else:
+            sections = self._generate_sections_without_analysis(plan_type, objective)
+
         # Estimate resources needed
         resource_estimate = self.resource_estimator.estimate_resources(objective)
 
+        resolved_duration = duration or self._select_duration(template["duration_options"])
+
+        objective_lower = objective.lower()
+
+        # One timestamp anchors the generated date, timeline and due dates
+        now = datetime.now()
+
         # Generate the plan
         plan = {
-            "title": f"{template['title']} - {objective[:50]}{'...' if len(objective) > 50 else ''}",
-            "generated_date": datetime.now().isoformat(),
+            "title": f"{template['title']} - {_truncate(objective, 50)}",
+            "generated_date": now.isoformat(),
             "objective": objective,
             "plan_type": plan_type,
-            "duration": duration or self._select_duration(template["duration_options"]),
-            "sections": self._generate_sections(template["sections"], objective, analysis),
+            "duration": resolved_duration,
+            "sections": sections,
             "resources_needed": resource_estimate,
             "estimated_budget": self._estimate_budget(resource_estimate),
-            "success_metrics": self._generate_success_metrics(objective),
-            "risks": self._identify_risks(objective),
-            "timeline": self._generate_timeline(duration or self._select_duration(template["duration_options"])),
-            "action_items": self._generate_action_items(objective),
+            "success_metrics": self._generate_success_metrics(objective, objective_lower),
+            "risks": self._identify_risks(objective, objective_lower),
+            "timeline": self._generate_timeline(resolved_duration, now),
+            "action_items": self._generate_action_items(objective, now),
             "analysis": analysis
         }
 
         return plan
 
-    def _select_duration(self, duration_options: List[str]) -> str:
+    def _select_duration(self, duration_options: Sequence[str]) -> str:
         """Select an appropriate duration from available options."""
         # Default to middle option if no specific requirement
         middle_index = len(duration_options) // 2
         return duration_options[middle_index]
 
-    def _generate_sections(self, section_names: List[str], objective: str,
+    def _generate_sections(self, section_names: Sequence[str], objective: str,
                           analysis: Dict[str, Any]) -> Dict[str, str]:
         """Generate content for each section of the plan."""
         sections = {}
@@ -309,30 +599,51 @@ class PlanGenerator:
 
         return sections
 
+    def _generate_sections_without_analysis(self, plan_type: str, objective: str) -> Dict[str, str]:
+        """Generate sections when the caller chose the plan type and no analysis ran.
+
+        Without key elements, only sections that mention the objective differ
+        between plans; the rest are rendered once per plan type and reused.
+        """
+        static = self._static_sections.get(plan_type)
+        if static is None:
+            static = self._static_sections[plan_type] = {
+                section_name: (
+                    None
+                    if getattr(self._section_dispatch[section_name], "__name__", None) in _OBJECTIVE_SECTIONS
+                    else self._generate_section_content(section_name, "", _NO_ANALYSIS)
+                )
+                for section_name in self.plan_templates[plan_type]["sections"]
+            }
+
+        return {
+            section_name: (
+                content if content is not None
+                else self._section_dispatch[section_name](objective, _NO_ANALYSIS)
+            )
+            for section_name, content in static.items()
+        }
+
+    def _resolve_section_handler(self, section_name: str):
+        """Find the content generator for a section name, or None for generic sections."""
+        section_lower = section_name.lower()
+        for keywords, method_name in _SECTION_HANDLERS:
+            if any(keyword in section_lower for keyword in keywords):
+                return getattr(self, method_name)
+        return None
+
     def _generate_section_content(self, section_name: str, objective: str,
                                  analysis: Dict[str, Any]) -> str:
         """Generate content for a specific section."""
-        section_lower = section_name.lower()
+        try:
+            handler = self._section_dispatch[section_name]
+        except KeyError:
+            handler = self._resolve_section_handler(section_name)
 
-        if "executive" in section_lower or "overview" in section_lower:
-            return self._generate_executive_summary(objective, analysis)
-        elif "objective" in section_lower or "goal" in section_lower:
-            return self._generate_objectives(objective, analysis)
-        elif "strategy" in section_lower or "tactic" in section_lower:
-            return self._generate_strategies(objective, analysis)
-        elif "timeline" in section_lower:
-            return self._generate_timeline_overview(analysis.get("key_elements", {}))
-        elif "resource" in section_lower or "budget" in section_lower:
-            return self._generate_resource_section(analysis.get("key_elements", {}))
-        elif "metric" in section_lower or "success" in section_lower:
-            return self._generate_metrics_section(analysis.get("key_elements", {}))
-        elif "risk" in section_lower:
-            return self._generate_risk_section(objective)
-        elif "action" in section_lower or "item" in section_lower:
-            return self._generate_action_items_section(objective)
-        else:
+        if handler is None:
             # Generic content for other sections
             return f"This section addresses the {section_name.lower()} aspect of the plan."
+        return handler(objective, analysis)
 
     def _generate_executive_summary(self, objective: str, analysis: Dict[str, Any]) -> str:
         """Generate executive summary content."""
@@ -360,59 +671,23 @@ class PlanGenerator:
 
     def _generate_objectives(self, objective: str, analysis: Dict[str, Any]) -> str:
         """Generate objectives and goals content."""
-        return f"Primary Objective: {objective}\n\n" \
-               f"Supporting Goals:\n" \
-               f"- Goal 1: Define specific, measurable outcome\n" \
-               f"- Goal 2: Establish clear timeline\n" \
-               f"- Goal 3: Identify success metrics\n" \
-               f"- Goal 4: Allocate necessary resources"
+        return _OBJECTIVES_TEMPLATE.format(objective=objective)
 
     def _generate_strategies(self, objective: str, analysis: Dict[str, Any]) -> str:
         """Generate strategies and tactics content."""
-        return f"To achieve {objective}, we will employ the following strategies:\n\n" \
-               f"1. Strategy One: Description of the first approach\n" \
-               f"   - Tactic 1a: Specific action\n" \
-               f"   - Tactic 1b: Specific action\n\n" \
-               f"2. Strategy Two: Description of the second approach\n" \
-               f"   - Tactic 2a: Specific action\n" \
-               f"   - Tactic 2b: Specific action\n\n" \
-               f"3. Strategy Three: Description of the third approach\n" \
-               f"   - Tactic 3a: Specific action\n" \
-               f"   - Tactic 3b: Specific action"
-
-    def _generate_timeline_overview(self, elements: Dict[str, Any]) -> str:
+        return _STRATEGIES_TEMPLATE.format(objective=objective)
+
+    def _generate_timeline_overview(self, objective: str, analysis: Dict[str, Any]) -> str:
         """Generate timeline overview content."""
-        return "Phase 1: Planning and Preparation (Weeks 1-2)\n" \
-               "  - Define requirements\n" \
-               "  - Assemble team\n" \
-               "  - Set up infrastructure\n\n" \
-               "Phase 2: Implementation (Weeks 3-6)\n" \
-               "  - Execute primary activities\n" \
-               "  - Monitor progress\n" \
-               "  - Make adjustments\n\n" \
-               "Phase 3: Evaluation and Optimization (Weeks 7-8)\n" \
-               "  - Assess outcomes\n" \
-               "  - Document learnings\n" \
-               "  - Plan next steps"
-
-    def _generate_resource_section(self, elements: Dict[str, Any]) -> str:
+        return _TIMELINE_OVERVIEW
+
+    def _generate_resource_section(self, objective: str, analysis: Dict[str, Any]) -> str:
         """Generate resource requirements content."""
-        return "Human Resources:\n" \
-               "  - Project Manager: 1 FTE\n" \
-               "  - Subject Matter Experts: 2-3 part-time\n" \
-               "  - Support Staff: As needed\n\n" \
-               "Material Resources:\n" \
-               "  - Software licenses\n" \
-               "  - Equipment\n" \
-               "  - Infrastructure\n\n" \
-               "Financial Resources:\n" \
-               "  - Personnel costs\n" \
-               "  - Operational expenses\n" \
-               "  - Contingency fund"
-
-    def _generate_metrics_section(self, elements: Dict[str, Any]) -> str:
+        return _RESOURCE_SECTION
+
+    def _generate_metrics_section(self, objective: str, analysis: Dict[str, Any]) -> str:
         """Generate success metrics content."""
-        metrics = elements.get("success_metrics", [])
+        metrics = analysis.get("key_elements", {}).get("success_metrics", [])
         base_metrics = [
             "Overall achievement of primary objective",
             "Timeline adherence",
@@ -421,7 +696,7 @@ class PlanGenerator:
         ]
 
         if metrics:
-            base_metrics.extend([f"{metric.title()} growth/improvement" for metric in metrics])
+            base_metrics.extend([f"{_titled(metric)} growth/improvement" for metric in metrics])
 
         result = "Primary Metrics:\n"
         for i, metric in enumerate(base_metrics, 1):
@@ -434,36 +709,13 @@ class PlanGenerator:
 
         return result
 
-    def _generate_risk_section(self, objective: str) -> str:
+    def _generate_risk_section(self, objective: str, analysis: Dict[str, Any]) -> str:
         """Generate risk assessment content."""
-        return "High Priority Risks:\n" \
-               "  - Resource availability\n" \
-               "  - Timeline constraints\n" \
-               "  - External dependencies\n\n" \
-               "Medium Priority Risks:\n" \
-               "  - Scope creep\n" \
-               "  - Stakeholder alignment\n" \
-               "  - Technology limitations\n\n" \
-               "Mitigation Strategies:\n" \
-               "  - Regular monitoring and reporting\n" \
-               "  - Clear communication protocols\n" \
-               "  - Contingency planning"
-
-    def _generate_action_items_section(self, objective: str) -> str:
+        return _RISK_SECTION
+
+    def _generate_action_items_section(self, objective: str, analysis: Dict[str, Any]) -> str:
         """Generate action items content."""
-        return "Immediate Actions (Week 1):\n" \
-               "  [ ] Define project scope and requirements\n" \
-               "  [ ] Identify and assemble project team\n" \
-               "  [ ] Establish communication channels\n" \
-               "  [ ] Set up project tracking tools\n\n" \
-               "Short-term Actions (Weeks 2-4):\n" \
-               "  [ ] Begin implementation activities\n" \
-               "  [ ] Conduct regular progress reviews\n" \
-               "  [ ] Address initial challenges\n\n" \
-               "Ongoing Actions:\n" \
-               "  [ ] Monitor KPIs and metrics\n" \
-               "  [ ] Communicate progress to stakeholders\n" \
-               "  [ ] Adapt approach based on feedback"
+        return _ACTION_ITEMS_SECTION
 
     def _estimate_budget(self, resources: Dict[str, Any]) -> str:
         """Estimate budget based on resources."""
@@ -490,7 +742,8 @@ class PlanGenerator:
 
         return "\n".join(breakdown)
 
-    def _generate_success_metrics(self, objective: str) -> List[str]:
+    def _generate_success_metrics(self, objective: str,
+                                  objective_lower: Optional[str] = None) -> List[str]:
         """Generate success metrics for the objective."""
         metrics = [
             f"Achievement of primary goal: {objective}",
@@ -501,7 +754,7 @@ class PlanGenerator:
         ]
 
         # Add specific metrics based on objective content
-        obj_lower = objective.lower()
+        obj_lower = objective_lower if objective_lower is not None else objective.lower()
         if 'customer' in obj_lower:
             metrics.extend([
                 "Customer satisfaction score",
@@ -523,7 +776,7 @@ class PlanGenerator:
 
         return metrics
 
-    def _identify_risks(self, objective: str) -> List[str]:
+    def _identify_risks(self, objective: str, objective_lower: Optional[str] = None) -> List[str]:
         """Identify potential risks for the objective."""
         risks = [
             "Resource availability constraints",
@@ -534,7 +787,7 @@ class PlanGenerator:
         ]
 
         # Add specific risks based on objective content
-        obj_lower = objective.lower()
+        obj_lower = objective_lower if objective_lower is not None else objective.lower()
         if 'new' in obj_lower or 'innovative' in obj_lower:
             risks.extend([
                 "Technical feasibility challenges",
@@ -550,7 +803,7 @@ class PlanGenerator:
 
         return risks
 
-    def _generate_timeline(self, duration: str) -> Dict[str, Any]:
+    def _generate_timeline(self, duration: str, now: Optional[datetime] = None) -> Dict[str, Any]:
         """Generate a detailed timeline."""
         # Parse duration to get time units
         duration_parts = duration.split()
@@ -558,27 +811,25 @@ class PlanGenerator:
         unit = duration_parts[1]
 
         # Calculate end date
-        start_date = datetime.now()
-        if 'day' in unit:
-            end_date = start_date + timedelta(days=num_units)
-        elif 'week' in unit:
-            end_date = start_date + timedelta(weeks=num_units)
-        elif 'month' in unit:
-            # Approximate: 30 days per month
-            end_date = start_date + timedelta(days=num_units * 30)
-        elif 'year' in unit:
-            end_date = start_date + timedelta(days=num_units * 365)
+        start_date = now or datetime.now()
+        days_per_unit = _DAYS_PER_UNIT.get(unit.lower().removesuffix("s"))
+        if days_per_unit is not None:
+            end_date = start_date + timedelta(days=num_units * days_per_unit)
         else:
             end_date = start_date + timedelta(days=30)  # Default to 30 days
 
+        start_iso = start_date.isoformat()
+        end_iso = end_date.isoformat()
         return {
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
+            "start_date": start_iso,
+            "end_date": end_iso,
             "duration": duration,
-            "milestones": self._generate_milestones(start_date, end_date)
+            "milestones": self._generate_milestones(start_date, end_date, start_iso, end_iso)
         }
 
-    def _generate_milestones(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
+    def _generate_milestones(self, start_date: datetime, end_date: datetime,
+                             start_iso: Optional[str] = None,
+                             end_iso: Optional[str] = None) -> List[Dict[str, Any]]:
         """Generate project milestones."""
         duration = end_date - start_date
         milestones = []
@@ -586,12 +837,12 @@ class PlanGenerator:
         # Add key milestones
         milestones.append({
             "name": "Project Kickoff",
-            "date": start_date.isoformat(),
+            "date": start_iso or start_date.isoformat(),
             "description": "Official project start and team alignment"
         })
 
         # Mid-project milestone
-        mid_point = start_date + (duration / 2)
+        mid_point = start_date + duration // 2
         milestones.append({
             "name": "Mid-Project Review",
             "date": mid_point.isoformat(),
@@ -601,33 +852,34 @@ class PlanGenerator:
         # Final milestone
         milestones.append({
             "name": "Project Completion",
-            "date": end_date.isoformat(),
+            "date": end_iso or end_date.isoformat(),
             "description": "Final delivery and evaluation"
         })
 
         return milestones
 
-    def _generate_action_items(self, objective: str) -> List[Dict[str, Any]]:
+    def _generate_action_items(self, objective: str, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Generate specific action items."""
+        now = now or datetime.now()
         return [
             {
                 "task": "Define detailed requirements",
                 "responsible": "Project Manager",
-                "due_date": (datetime.now() + timedelta(days=7)).isoformat(),
+                "due_date": (now + timedelta(days=7)).isoformat(),
                 "priority": "High",
                 "status": "Not Started"
             },
             {
                 "task": "Assemble project team",
                 "responsible": "Department Head",
-                "due_date": (datetime.now() + timedelta(days=5)).isoformat(),
+                "due_date": (now + timedelta(days=5)).isoformat(),
                 "priority": "High",
                 "status": "Not Started"
             },
             {
                 "task": "Establish success metrics",
                 "responsible": "Analytics Team",
-                "due_date": (datetime.now() + timedelta(days=10)).isoformat(),
+                "due_date": (now + timedelta(days=10)).isoformat(),
                 "priority": "Medium",
                 "status": "Not Started"
             }
@@ -643,67 +895,75 @@ class PlanGenerator:
         Returns:
             Path to the saved file
         """
-        md_content = f"# {plan['title']}\n\n"
-        md_content += f"*Generated on: {plan['generated_date']}*\n\n"
-        md_content += f"**Objective:** {plan['objective']}\n\n"
-
-        # Add plan details
-        md_content += "## Plan Details\n\n"
-        md_content += f"- **Type:** {plan['plan_type'].replace('_', ' ').title()}\n"
-        md_content += f"- **Duration:** {plan['duration']}\n"
-        md_content += f"- **Estimated Budget:** {plan['estimated_budget'].split('\\n')[0]}\n\n"
-
-        # Add each section
-        for section_name, content in plan['sections'].items():
-            md_content += f"## {section_name}\n\n{content}\n\n"
-
-        # Add resources needed
-        md_content += "## Resources Needed\n\n"
-        for resource_type, details in plan['resources_needed'].items():
-            md_content += f"### {resource_type.title()}\n"
-            if isinstance(details, dict):
-                for key, value in details.items():
-                    md_content += f"- **{key.title()}:** {value}\n"
-            else:
-                md_content += f"- {details}\n"
-            md_content += "\n"
-
-        # Add timeline
-        md_content += "## Timeline\n\n"
-        md_content += f"**Start Date:** {plan['timeline']['start_date']}\n\n"
-        md_content += f"**End Date:** {plan['timeline']['end_date']}\n\n"
-        md_content += f"**Duration:** {plan['timeline']['duration']}\n\n"
-
-        md_content += "### Milestones\n\n"
-        for milestone in plan['timeline']['milestones']:
-            md_content += f"- **{milestone['name']}** ({milestone['date']}): {milestone['description']}\n"
-
-        # Add success metrics
-        md_content += "\n## Success Metrics\n\n"
-        for i, metric in enumerate(plan['success_metrics'], 1):
-            md_content += f"{i}. {metric}\n"
-
-        # Add risks
-        md_content += "\n## Risk Assessment\n\n"
-        for i, risk in enumerate(plan['risks'], 1):
-            md_content += f"{i}. {risk}\n"
-
-        # Add action items
-        md_content += "\n## Action Items\n\n"
-        md_content += "| Task | Responsible | Due Date | Priority | Status |\n"
-        md_content += "|------|-------------|----------|----------|--------|\n"
-        for item in plan['action_items']:
-            md_content += f"| {item['task']} | {item['responsible']} | {item['due_date']} | {item['priority']} | {item['status']} |\n"
-
-        # Add analysis if available
-        if 'analysis' in plan:
-            md_content += "\n## Analysis\n\n"
-            md_content += f"**Confidence Level:** {plan['analysis'].get('confidence', 'N/A')}\n\n"
-            md_content += "### Historical Context\n\n"
-            hist_ctx = plan['analysis'].get('historical_context', {})
-            md_content += f"- **Similar Past Projects:** {hist_ctx.get('similar_past_projects', 0)}\n"
-
-        output_path.write_text(md_content, encoding='utf-8')
+        # Only the first budget line (the personnel estimate) goes in the details
+        budget_line = plan['estimated_budget'].partition('\n')[0]
+
+        with output_path.open('w', encoding='utf-8', buffering=1 << 16) as f:
+            write = f.write
+            writelines = f.writelines
+            writelines((
+                f"# {plan['title']}\n\n",
+                f"*Generated on: {plan['generated_date']}*\n\n",
+                f"**Objective:** {plan['objective']}\n\n",
+                # Add plan details
+                "## Plan Details\n\n",
+                f"- **Type:** {_PLAN_TYPE_TITLES.get(plan['plan_type']) or plan['plan_type'].replace('_', ' ').title()}\n",
+                f"- **Duration:** {plan['duration']}\n",
+                f"- **Estimated Budget:** {budget_line}\n\n",
+            ))
+
+            # Add each section
+            for section_name, content in plan['sections'].items():
+                write(f"## {section_name}\n\n{content}\n\n")
+
+            # Add resources needed
+            write("## Resources Needed\n\n")
+            for resource_type, details in plan['resources_needed'].items():
+                write(f"### {_titled(resource_type)}\n")
+                if isinstance(details, dict):
+                    writelines(f"- **{_titled(key)}:** {value}\n" for key, value in details.items())
+                else:
+                    write(f"- {details}\n")
+                write("\n")
+
+            # Add timeline
+            timeline = plan['timeline']
+            write("## Timeline\n\n")
+            write(f"**Start Date:** {timeline['start_date']}\n\n")
+            write(f"**End Date:** {timeline['end_date']}\n\n")
+            write(f"**Duration:** {timeline['duration']}\n\n")
+
+            write("### Milestones\n\n")
+            writelines(
+                f"- **{milestone['name']}** ({milestone['date']}): {milestone['description']}\n"
+                for milestone in timeline['milestones']
+            )
+
+            # Add success metrics
+            write("\n## Success Metrics\n\n")
+            writelines(f"{i}. {metric}\n" for i, metric in enumerate(plan['success_metrics'], 1))
+
+            # Add risks
+            write("\n## Risk Assessment\n\n")
+            writelines(f"{i}. {risk}\n" for i, risk in enumerate(plan['risks'], 1))
+
+            # Add action items
+            write("\n## Action Items\n\n")
+            write("| Task | Responsible | Due Date | Priority | Status |\n")
+            write("|------|-------------|----------|----------|--------|\n")
+            writelines(
+                f"| {item['task']} | {item['responsible']} | {item['due_date']} | {item['priority']} | {item['status']} |\n"
+                for item in plan['action_items']
+            )
+
+            # Add analysis if available
+            if 'analysis' in plan:
+                write("\n## Analysis\n\n")
+                write(f"**Confidence Level:** {plan['analysis'].get('confidence', 'N/A')}\n\n")
+                write("### Historical Context\n\n")
+                hist_ctx = plan['analysis'].get('historical_context', {})
+                write(f"- **Similar Past Projects:** {hist_ctx.get('similar_past_projects', 0)}\n")
+
         return output_path
 
 
@@ -712,83 +972,99 @@ class ResourceEstimator:
 
     def estimate_resources(self, objective: str) -> Dict[str, Any]:
         """Estimate resources needed based on the objective."""
-        obj_lower = objective.lower()
+        tags, personnel_cost, materials_cost, tools_cost = _derive_costs_and_resources(objective.lower())
 
         resources = {
             "personnel": {
                 "roles": [],
                 "estimation_basis": "Based on objective requirements",
-                "cost": self._estimate_personnel_cost(obj_lower)
+                "cost": personnel_cost
             },
             "materials": {
                 "items": [],
                 "estimation_basis": "Standard requirements for this type of objective",
-                "cost": self._estimate_materials_cost(obj_lower)
+                "cost": materials_cost
             },
             "tools": {
                 "software": [],
                 "estimation_basis": "Required for effective execution",
-                "cost": self._estimate_tools_cost(obj_lower)
+                "cost": tools_cost
             }
         }
 
         # Determine specific needs based on objective
-        if 'digital' in obj_lower or 'online' in obj_lower or 'web' in obj_lower:
-            resources["tools"]["software"] = ["Project management software", "Design tools", "Analytics platform"]
-            resources["materials"]["items"] = ["Digital infrastructure", "Online marketing materials"]
-
-        if 'marketing' in obj_lower or 'promotion' in obj_lower:
-            resources["personnel"]["roles"] = ["Marketing Specialist", "Content Creator", "Analyst"]
-            resources["materials"]["items"] = ["Marketing materials", "Campaign assets", "Promotional items"]
-
-        if 'development' in obj_lower or 'building' in obj_lower:
-            resources["personnel"]["roles"] = ["Developer", "Designer", "QA Engineer"]
-            resources["materials"]["items"] = ["Development tools", "Testing environments", "Documentation systems"]
+        software, items, roles = _RESOURCE_NEEDS[tags & _NEED_TAGS]
+        resources["tools"]["software"] = list(software)
+        resources["materials"]["items"] = list(items)
+        resources["personnel"]["roles"] = list(roles)
 
         return resources
 
-    def _estimate_personnel_cost(self, objective: str) -> int:
-        """Estimate personnel costs."""
+    @staticmethod
+    def _estimate_personnel_cost(tags: frozenset) -> int:
+        """Estimate personnel costs from the objective's resource tags."""
         # Base cost calculation
         base_cost = 5000  # $5k per person-month average
 
         # Adjust based on objective complexity
-        if any(word in objective for word in ['complex', 'advanced', 'sophisticated']):
+        if 'complex' in tags:
             base_cost *= 1.5
-        elif any(word in objective for word in ['simple', 'basic', 'routine']):
+        elif 'simple' in tags:
             base_cost *= 0.7
 
         # Number of people estimation
-        if 'team' in objective or 'collaboration' in objective:
+        if 'team' in tags:
             num_people = 3
-        elif 'individual' in objective or 'personal' in objective:
+        elif 'individual' in tags:
             num_people = 1
         else:
             num_people = 2  # Default assumption
 
         return base_cost * num_people
 
-    def _estimate_materials_cost(self, objective: str) -> int:
-        """Estimate materials costs."""
+    @staticmethod
+    def _estimate_materials_cost(tags: frozenset) -> int:
+        """Estimate materials costs from the objective's resource tags."""
         base_cost = 1000  # $1k base materials cost
 
-        if 'physical' in objective or 'hardware' in objective:
+        if 'physical' in tags:
             base_cost *= 3
-        elif 'digital' in objective or 'online' in objective:
+        elif 'digital' in tags:
             base_cost *= 0.5  # Digital typically lower material cost
 
         return base_cost
 
-    def _estimate_tools_cost(self, objective: str) -> int:
-        """Estimate tools/software costs."""
+    @staticmethod
+    def _estimate_tools_cost(tags: frozenset) -> int:
+        """Estimate tools/software costs from the objective's resource tags."""
         base_cost = 2000  # $2k base tools cost
 
-        if 'ai' in objective or 'machine learning' in objective or 'data' in objective:
+        if 'data' in tags:
             base_cost *= 2  # AI/data tools often more expensive
 
         return base_cost
 
 
+@lru_cache(maxsize=512)
+def _derive_costs_and_resources(objective_lower: str) -> tuple:
+    """Return the resource tags and the personnel, materials and tools costs.
+
+    Depends only on the lower-cased objective, so results are memoized; the
+    returned tuple is immutable and safe to share between plans.
+    """
+    tags = _resource_tags(objective_lower)
+    return (
+        tags,
+        ResourceEstimator._estimate_personnel_cost(tags),
+        ResourceEstimator._estimate_materials_cost(tags),
+        ResourceEstimator._estimate_tools_cost(tags),
+    )
+
+
+# Stateless, so one instance serves every generator.
+_RESOURCE_ESTIMATOR = ResourceEstimator()
+
+
 # Example usage
 if __name__ == "__main__":
     generator = PlanGenerator()
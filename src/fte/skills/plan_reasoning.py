@@ -1,8 +1,79 @@
 """Plan Reasoning Skill - Process Plan.md files with Claude reasoning loop."""
 
+import os
+import stat
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Any
-from ..reasoning.reasoning_engine import ReasoningEngine, process_plan_file
+from typing import Dict, Any, Optional
+from ..reasoning.reasoning_engine import ReasoningEngine
+
+# Reasoning results keyed by plan file, vault and the file's mtime and size, so
+# back-to-back calls on an unchanged plan parse and reason over it once.
+_PLAN_CACHE_SIZE = 128
+_plan_results: Dict[tuple, Dict[str, Any]] = {}
+
+# One reasoning engine per vault, shared by every function in this module.
+_engines: Dict[Path | None, ReasoningEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def _get_engine(vault_path: str | Path | None) -> ReasoningEngine:
+    """Get the shared reasoning engine for a vault path."""
+    key = Path(vault_path).resolve() if vault_path is not None else None
+    engine = _engines.get(key)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(key)
+            if engine is None:
+                engine = _engines[key] = ReasoningEngine(vault_path=vault_path)
+    return engine
+
+
+def _write_atomically(path: Path, content: str):
+    """Replace a file's content via a uniquely named temporary file beside it.
+
+    Each writer gets its own temporary file, so concurrent updates never
+    share one, and the temporary file is removed if the write fails.
+    """
+    tmp_file = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    )
+    tmp_path = Path(tmp_file.name)
+    try:
+        with tmp_file:
+            tmp_file.write(content)
+        # NamedTemporaryFile creates the file owner-only; keep the plan's permissions
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _plan_cache_key(plan_file_path: str, vault_path: str | Path | None) -> tuple:
+    """Build the result-cache key for a plan file in its current state."""
+    st = os.stat(plan_file_path)
+    return (os.path.abspath(plan_file_path), str(vault_path), st.st_mtime_ns, st.st_size)
+
+
+def _cached_process(
+    plan_file_path: str,
+    vault_path: str | Path | None,
+    key: Optional[tuple] = None,
+) -> Dict[str, Any]:
+    """Process a plan file, reusing the result while the file is unchanged.
+
+    Results are shared between calls, so treat them as read-only.
+    """
+    if key is None:
+        key = _plan_cache_key(plan_file_path, vault_path)
+    result = _plan_results.get(key)
+    if result is None:
+        if len(_plan_results) >= _PLAN_CACHE_SIZE:
+            del _plan_results[next(iter(_plan_results))]
+        result = _plan_results[key] = _get_engine(vault_path).process_plan_file(plan_file_path)
+    return result
 
 
 def analyze_plan(
@@ -19,7 +90,7 @@ def analyze_plan(
         Dictionary with analysis results
     """
     try:
-        result = process_plan_file(plan_file_path, vault_path)
+        result = _cached_process(plan_file_path, vault_path)
 
         return {
             "success": True,
@@ -48,8 +119,7 @@ def generate_action_plan(
         Dictionary with action plan
     """
     try:
-        engine = ReasoningEngine(vault_path=vault_path)
-        result = engine.process_plan_file(plan_file_path)
+        result = _cached_process(plan_file_path, vault_path)
 
         action_plan = result.get("action_plan", {})
 
@@ -80,8 +150,7 @@ def create_plan_summary(
         Dictionary with plan summary
     """
     try:
-        engine = ReasoningEngine(vault_path=vault_path)
-        result = engine.process_plan_file(plan_file_path)
+        result = _cached_process(plan_file_path, vault_path)
 
         analysis = result.get("analysis", {})
         goals_analysis = analysis.get("goals_analysis", {})
@@ -124,8 +193,7 @@ def process_all_plans(
         Dictionary with results from processing all plans
     """
     try:
-        engine = ReasoningEngine(vault_path=vault_path)
-        results = engine.process_all_plans_in_vault()
+        results = _get_engine(vault_path).process_all_plans_in_vault()
 
         return {
             "success": True,
@@ -154,15 +222,15 @@ def update_plan_with_reasoning(
         Dictionary with update results
     """
     try:
-        engine = ReasoningEngine(vault_path=vault_path)
-        result = engine.process_plan_file(plan_file_path)
+        engine = _get_engine(vault_path)
+        key = _plan_cache_key(plan_file_path, vault_path)
+        result = _cached_process(plan_file_path, vault_path, key)
 
         # Create updated Plan.md content
         updated_content = engine.create_plan_markdown(result)
 
-        # Write back to file
-        with open(plan_file_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        _write_atomically(Path(plan_file_path), updated_content)
+        _plan_results.pop(key, None)
 
         return {
             "success": True,
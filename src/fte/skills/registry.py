@@ -4,12 +4,79 @@ Skill Registry - Centralized skill discovery, configuration management, and runt
 import asyncio
 import importlib
 import json
+from collections import deque
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Type
 from .framework import BaseSkill, SkillRegistry as FrameworkSkillRegistry
 from ..vault_manager import VaultManager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Configuration changes made within this window are written to the vault once
+_SAVE_DEBOUNCE_SECONDS = 0.1
+
+# Configurations are saved under the "config" category, which the vault files in Done
+_CONFIG_NAME = "skill_registry_config"
+_CONFIG_PATH = Path("Done") / _CONFIG_NAME
+
+# Immutable so every registry can copy from it without sharing mutable state
+_DEFAULT_CONFIGURATIONS = MappingProxyType({
+    "business_intelligence": MappingProxyType({
+        "module_path": "src.fte.skills.business_intelligence",
+        "class_name": "BusinessIntelligenceSkill",
+        "enabled": True,
+        "auto_load": True,
+        "dependencies": (),
+        "config": MappingProxyType({})
+    }),
+    "customer_outreach": MappingProxyType({
+        "module_path": "src.fte.skills.customer_outreach",
+        "class_name": "CustomerOutreachSkill",
+        "enabled": True,
+        "auto_load": True,
+        "dependencies": (),
+        "config": MappingProxyType({})
+    }),
+    "sales_pipeline": MappingProxyType({
+        "module_path": "src.fte.skills.sales_pipeline",
+        "class_name": "SalesPipelineSkill",
+        "enabled": True,
+        "auto_load": True,
+        "dependencies": (),
+        "config": MappingProxyType({})
+    }),
+    "content_strategy": MappingProxyType({
+        "module_path": "src.fte.skills.content_strategy",
+        "class_name": "ContentStrategySkill",
+        "enabled": True,
+        "auto_load": True,
+        "dependencies": (),
+        "config": MappingProxyType({})
+    }),
+    "linkedin_post_generator": MappingProxyType({
+        "module_path": "src.fte.skills.linkedin_post_generator",
+        "class_name": "LinkedInPostGenerator",
+        "enabled": True,
+        "auto_load": True,
+        "dependencies": (),
+        "config": MappingProxyType({})
+    }),
+    "plan_generator": MappingProxyType({
+        "module_path": "src.fte.skills.plan_generator",
+        "class_name": "PlanGenerator",
+        "enabled": True,
+        "auto_load": True,
+        "dependencies": (),
+        "config": MappingProxyType({})
+    })
+})
+
 
 class SkillRegistry:
     """Centralized registry for discovering, configuring, and managing skills at runtime."""
@@ -24,77 +91,114 @@ class SkillRegistry:
         self.vault_manager = VaultManager(vault_path)
         self.skill_configurations: Dict[str, Dict[str, Any]] = {}
         self.loaded_modules: Dict[str, Any] = {}
+        # Skill classes resolved from their modules, keyed by (module_path, class_name)
+        self._skill_classes: Dict[tuple, Type[BaseSkill]] = {}
         self.skill_instances: Dict[str, BaseSkill] = {}
         self.activation_states: Dict[str, bool] = {}
+        # One lock per skill so concurrent loads of the same skill instantiate it once
+        self._load_locks: Dict[str, asyncio.Lock] = {}
+        # Reverse dependency index: skill name -> names of skills that depend on it,
+        # kept in configuration order (dicts used as ordered sets)
+        self._dependents: Dict[str, Dict[str, None]] = {}
+        # Debounced configuration writes
+        self._config_dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        # hash() of the last payload written or loaded, to skip identical saves
+        self._last_config_hash: Optional[int] = None
+        # Bumped by every change that affects the status report
+        self._mutation_version = 0
+        self._report_cache: Optional[tuple] = None
+        self._enabled_cache: Optional[tuple] = None
 
         # Load initial configurations
         self._load_skill_configurations()
 
     def _load_skill_configurations(self):
-        """Load skill configurations from vault."""
-        try:
-            config_content = self.vault_manager.get_content("skill_registry_config.json")
-            if config_content:
-                self.skill_configurations = json.loads(config_content)
+        """Load skill configurations from vault, falling back to the defaults."""
+        self._mutation_version += 1
+        config_content = None
+        if self.vault_manager.exists(_CONFIG_PATH):
+            config_content = self.vault_manager.read_file(_CONFIG_PATH)
+
+        if config_content:
+            try:
+                self.skill_configurations = orjson.loads(config_content) if ORJSON_AVAILABLE else json.loads(config_content)
+            except ValueError as e:
+                print(f"Error parsing skill configurations, using defaults: {e}")
+                # Keep the unreadable file for inspection instead of overwriting it
+                corrupt_path = self.vault_manager.vault_path / _CONFIG_PATH
+                try:
+                    corrupt_path.rename(corrupt_path.with_name(
+                        f"{corrupt_path.name}.corrupt-{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                    ))
+                except OSError as rename_error:
+                    print(f"Could not set aside corrupt skill configurations: {rename_error}")
             else:
-                # Set up default configurations
-                self._setup_default_configurations()
-        except Exception:
-            # Set up default configurations if loading fails
-            self._setup_default_configurations()
+                self._last_config_hash = hash(config_content)
+                self._rebuild_dependents()
+                return
+
+        self._setup_default_configurations()
 
     def _setup_default_configurations(self):
         """Set up default skill configurations."""
         self.skill_configurations = {
-            "business_intelligence": {
-                "module_path": "src.fte.skills.business_intelligence",
-                "class_name": "BusinessIntelligenceSkill",
-                "enabled": True,
-                "auto_load": True,
-                "dependencies": [],
-                "config": {}
-            },
-            "customer_outreach": {
-                "module_path": "src.fte.skills.customer_outreach",
-                "class_name": "CustomerOutreachSkill",
-                "enabled": True,
-                "auto_load": True,
-                "dependencies": [],
-                "config": {}
-            },
-            "sales_pipeline": {
-                "module_path": "src.fte.skills.sales_pipeline",
-                "class_name": "SalesPipelineSkill",
-                "enabled": True,
-                "auto_load": True,
-                "dependencies": [],
-                "config": {}
-            },
-            "content_strategy": {
-                "module_path": "src.fte.skills.content_strategy",
-                "class_name": "ContentStrategySkill",
-                "enabled": True,
-                "auto_load": True,
-                "dependencies": [],
-                "config": {}
-            },
-            "linkedin_post_generator": {
-                "module_path": "src.fte.skills.linkedin_post_generator",
-                "class_name": "LinkedInPostGenerator",
-                "enabled": True,
-                "auto_load": True,
-                "dependencies": [],
-                "config": {}
-            },
-            "plan_generator": {
-                "module_path": "src.fte.skills.plan_generator",
-                "class_name": "PlanGenerator",
-                "enabled": True,
-                "auto_load": True,
-                "dependencies": [],
-                "config": {}
-            }
+            name: {**config, "dependencies": list(config["dependencies"]), "config": dict(config["config"])}
+            for name, config in _DEFAULT_CONFIGURATIONS.items()
+        }
+        self._rebuild_dependents()
+
+    def _rebuild_dependents(self):
+        """Rebuild the reverse dependency index from the current configurations."""
+        self._dependents = {}
+        for name, config in self.skill_configurations.items():
+            for dep in config.get("dependencies", []):
+                self._dependents.setdefault(dep, {})[name] = None
+
+    def _index_dependencies(self, skill_name: str, old_dependencies, new_dependencies):
+        """Move skill_name in the reverse dependency index from its old to its new dependencies."""
+        for dep in old_dependencies:
+            dependents = self._dependents.get(dep)
+            if dependents is not None:
+                dependents.pop(skill_name, None)
+                if not dependents:
+                    del self._dependents[dep]
+        # Appending keeps configuration order unless an earlier skill changed
+        appends_in_order = next(reversed(self.skill_configurations), None) == skill_name
+        for dep in new_dependencies:
+            dependents = self._dependents.setdefault(dep, {})
+            if skill_name in dependents:
+                continue
+            dependents[skill_name] = None
+            if not appends_in_order:
+                self._dependents[dep] = {
+                    name: None for name in self.skill_configurations if name in dependents
+                }
+
+    def _dependency_order(self, skill_names: List[str]) -> List[str]:
+        """Order skills so each comes after the dependencies it shares a list with.
+
+        Uses Kahn's algorithm over the reverse dependency index; skills caught in
+        a dependency cycle are appended last in their original order.
+        """
+        members = set(skill_names)
+        remaining = {
+            name: members.intersection(self.skill_configurations[name].get("dependencies", []))
+            for name in skill_names
         }
+        ready = deque(name for name, deps in remaining.items() if not deps)
+        order = []
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for dependent in self._dependents.get(name, ()):
+                deps = remaining.get(dependent)
+                if deps and name in deps:
+                    deps.discard(name)
+                    if not deps:
+                        ready.append(dependent)
+        order.extend(name for name, deps in remaining.items() if deps)
+        return order
 
     def register_skill_type(self, skill_name: str, module_path: str, class_name: str,
                            enabled: bool = True, auto_load: bool = True,
@@ -111,6 +215,7 @@ class SkillRegistry:
             dependencies: List of skill dependencies
             config: Additional configuration for the skill
         """
+        previous = self.skill_configurations.get(skill_name, {})
         self.skill_configurations[skill_name] = {
             "module_path": module_path,
             "class_name": class_name,
@@ -119,6 +224,7 @@ class SkillRegistry:
             "dependencies": dependencies or [],
             "config": config or {}
         }
+        self._index_dependencies(skill_name, previous.get("dependencies", []), dependencies or [])
 
         # Save configuration to vault
         self._save_configurations()
@@ -148,7 +254,12 @@ class SkillRegistry:
         Returns:
             List of enabled skill names
         """
-        return [name for name, config in self.skill_configurations.items() if config["enabled"]]
+        if self._enabled_cache is None or self._enabled_cache[0] != self._mutation_version:
+            self._enabled_cache = (
+                self._mutation_version,
+                tuple(name for name, config in self.skill_configurations.items() if config["enabled"])
+            )
+        return list(self._enabled_cache[1])
 
     def list_loaded_skills(self) -> List[str]:
         """Get list of currently loaded skill names.
@@ -187,16 +298,26 @@ class SkillRegistry:
                 print(f"Dependency {dep_name} not loaded for skill {skill_name}")
                 return None
 
-        try:
-            # Import the skill module
-            if config["module_path"] not in self.loaded_modules:
-                module = importlib.import_module(config["module_path"])
-                self.loaded_modules[config["module_path"]] = module
-            else:
-                module = self.loaded_modules[config["module_path"]]
+        async with self._load_locks.setdefault(skill_name, asyncio.Lock()):
+            if skill_name in self.skill_instances:
+                return self.skill_instances[skill_name]
+            return await self._instantiate_skill(skill_name, config)
 
-            # Get the skill class
-            skill_class = getattr(module, config["class_name"])
+    async def _instantiate_skill(self, skill_name: str, config: Dict[str, Any]) -> Optional[BaseSkill]:
+        """Import, construct and configure a skill; called with its load lock held."""
+        try:
+            class_key = (config["module_path"], config["class_name"])
+            skill_class = self._skill_classes.get(class_key)
+            if skill_class is None:
+                # Import the skill module off the event loop; cold imports can be slow
+                if config["module_path"] not in self.loaded_modules:
+                    module = await asyncio.to_thread(importlib.import_module, config["module_path"])
+                    self.loaded_modules[config["module_path"]] = module
+                else:
+                    module = self.loaded_modules[config["module_path"]]
+
+                # Get the skill class
+                skill_class = self._skill_classes[class_key] = getattr(module, config["class_name"])
 
             # Instantiate the skill
             skill_instance = skill_class(name=skill_name, vault_path=self.vault_manager.vault_path)
@@ -211,6 +332,7 @@ class SkillRegistry:
 
             # Set activation state
             self.activation_states[skill_name] = False
+            self._mutation_version += 1
 
             print(f"Successfully loaded skill: {skill_name}")
             return skill_instance
@@ -239,6 +361,7 @@ class SkillRegistry:
         del self.skill_instances[skill_name]
         if skill_name in self.activation_states:
             del self.activation_states[skill_name]
+        self._mutation_version += 1
 
         print(f"Successfully unloaded skill: {skill_name}")
         return True
@@ -266,6 +389,8 @@ class SkillRegistry:
         except Exception as e:
             print(f"Error activating skill {skill_name}: {e}")
             return False
+        finally:
+            self._mutation_version += 1
 
     async def deactivate_skill(self, skill_name: str) -> bool:
         """Deactivate an active skill.
@@ -290,6 +415,8 @@ class SkillRegistry:
         except Exception as e:
             print(f"Error deactivating skill {skill_name}: {e}")
             return False
+        finally:
+            self._mutation_version += 1
 
     def is_skill_loaded(self, skill_name: str) -> bool:
         """Check if a skill is loaded.
@@ -346,6 +473,9 @@ class SkillRegistry:
                 "message": str(e),
                 "skill": skill_name
             }
+        finally:
+            # Execution updates the skill's status and stats
+            self._mutation_version += 1
 
     def update_skill_configuration(self, skill_name: str, **kwargs) -> bool:
         """Update configuration for a skill.
@@ -361,12 +491,16 @@ class SkillRegistry:
             return False
 
         config = self.skill_configurations[skill_name]
+        old_dependencies = config.get("dependencies", [])
 
         # Update configuration
         for key, value in kwargs.items():
             if key in config:
                 config[key] = value
 
+        if config.get("dependencies", []) is not old_dependencies:
+            self._index_dependencies(skill_name, old_dependencies, config["dependencies"])
+
         # Save updated configuration
         self._save_configurations()
 
@@ -374,18 +508,89 @@ class SkillRegistry:
         return True
 
     def _save_configurations(self):
-        """Save skill configurations to vault."""
+        """Mark configurations changed and schedule a coalesced save to the vault.
+
+        Inside a running event loop the write happens once after a short
+        debounce window (or on flush_configurations()); otherwise it is immediate.
+        """
+        self._config_dirty = True
+        self._mutation_version += 1
         try:
-            self.vault_manager.save_content(
-                "skill_registry_config",
-                json.dumps(self.skill_configurations, indent=2, default=str),
-                category="config"
-            )
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_now()
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        """Write pending configuration changes after the debounce window."""
+        try:
+            await asyncio.sleep(_SAVE_DEBOUNCE_SECONDS)
+        except asyncio.CancelledError:
+            # The loop is shutting down (e.g. asyncio.run returning); write
+            # before the task goes away so the changes are not lost
+            self._flush_now()
+            raise
+        await self.flush_configurations()
+
+    def _flush_now(self):
+        """Write pending configuration changes to the vault synchronously."""
+        if self._config_dirty:
+            payload = self._serialize_configurations()
+            if payload is not None:
+                self._write_configurations(payload)
+
+    async def aclose(self):
+        """Wait for any scheduled configuration save and write what is still pending.
+
+        Call before the event loop that owns the registry goes away.
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        self._flush_task = None
+        await self.flush_configurations()
+
+    async def flush_configurations(self):
+        """Write pending configuration changes to the vault now."""
+        if self._config_dirty:
+            # Serialize on the loop so the snapshot is consistent; write off it
+            payload = self._serialize_configurations()
+            if payload is not None:
+                await asyncio.to_thread(self._write_configurations, payload)
+
+    def _serialize_configurations(self) -> Optional[str]:
+        """Serialize configurations as indented JSON and clear the dirty flag.
+
+        Returns:
+            The JSON payload, or None if it matches what the vault already holds
+        """
+        self._config_dirty = False
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(self.skill_configurations, default=str, option=orjson.OPT_INDENT_2).decode()
+        else:
+            payload = json.dumps(self.skill_configurations, indent=2, default=str)
+
+        payload_hash = hash(payload)
+        if payload_hash == self._last_config_hash:
+            return None
+        self._last_config_hash = payload_hash
+        return payload
+
+    def _write_configurations(self, payload: str):
+        """Save serialized skill configurations to vault."""
+        try:
+            self.vault_manager.save_content(_CONFIG_NAME, payload, category="config")
         except Exception as e:
+            # Forget the hash so the next save retries the write
+            self._last_config_hash = None
             print(f"Error saving skill configurations: {e}")
 
     async def batch_load_skills(self, skill_names: List[str]) -> Dict[str, bool]:
-        """Load multiple skills at once.
+        """Load multiple skills concurrently.
+
+        A skill waits for any of its dependencies listed earlier in the batch,
+        so dependencies still load before their dependents.
 
         Args:
             skill_names: List of skill names to load
@@ -393,14 +598,30 @@ class SkillRegistry:
         Returns:
             Dictionary mapping skill names to load success status
         """
+        tasks: Dict[str, asyncio.Future] = {}
+
+        async def load_after(skill_name: str, prerequisites: List[asyncio.Future]):
+            if prerequisites:
+                await asyncio.gather(*prerequisites, return_exceptions=True)
+            return await self.load_skill(skill_name)
+
+        for skill_name in dict.fromkeys(skill_names):
+            dependencies = self.skill_configurations.get(skill_name, {}).get("dependencies", [])
+            prerequisites = [tasks[dep] for dep in dependencies if dep in tasks]
+            tasks[skill_name] = asyncio.ensure_future(load_after(skill_name, prerequisites))
+
+        outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
         results = {}
-        for skill_name in skill_names:
-            success = await self.load_skill(skill_name) is not None
-            results[skill_name] = success
+        for skill_name, outcome in zip(tasks, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"Error loading skill {skill_name}: {outcome}")
+                outcome = None
+            results[skill_name] = outcome is not None
         return results
 
     async def batch_activate_skills(self, skill_names: List[str]) -> Dict[str, bool]:
-        """Activate multiple skills at once.
+        """Activate multiple skills concurrently.
 
         Args:
             skill_names: List of skill names to activate
@@ -408,13 +629,12 @@ class SkillRegistry:
         Returns:
             Dictionary mapping skill names to activation success status
         """
-        results = {}
-        for skill_name in skill_names:
-            results[skill_name] = await self.activate_skill(skill_name)
-        return results
+        names = list(dict.fromkeys(skill_names))
+        outcomes = await asyncio.gather(*(self.activate_skill(name) for name in names))
+        return dict(zip(names, outcomes))
 
     async def batch_deactivate_skills(self, skill_names: List[str]) -> Dict[str, bool]:
-        """Deactivate multiple skills at once.
+        """Deactivate multiple skills concurrently.
 
         Args:
             skill_names: List of skill names to deactivate
@@ -422,17 +642,35 @@ class SkillRegistry:
         Returns:
             Dictionary mapping skill names to deactivation success status
         """
-        results = {}
-        for skill_name in skill_names:
-            results[skill_name] = await self.deactivate_skill(skill_name)
-        return results
+        names = list(dict.fromkeys(skill_names))
+        outcomes = await asyncio.gather(*(self.deactivate_skill(name) for name in names))
+        return dict(zip(names, outcomes))
 
     def get_skill_status_report(self) -> Dict[str, Any]:
         """Get a comprehensive status report of all skills.
 
+        The report structure is rebuilt only after the registry changes and the
+        same dictionary is returned until then, so treat it as read-only. The
+        status and last-updated time of loaded skills are refreshed on every
+        call, since skills can change them without going through the registry.
+
         Returns:
             Dictionary with status information for all skills
         """
+        if self._report_cache is None or self._report_cache[0] != self._mutation_version:
+            self._report_cache = (self._mutation_version, self._build_status_report())
+
+        report = self._report_cache[1]
+        skills_info = report["skills"]
+        for skill_name, skill in self.skill_instances.items():
+            skill_info = skills_info.get(skill_name)
+            if skill_info is not None:
+                skill_info["status"] = skill.status.value
+                skill_info["last_updated"] = skill.metadata.last_updated_iso
+        return report
+
+    def _build_status_report(self) -> Dict[str, Any]:
+        """Build the status report for get_skill_status_report."""
         report = {
             "registered_skills": len(self.skill_configurations),
             "loaded_skills": len(self.skill_instances),
@@ -453,23 +691,53 @@ class SkillRegistry:
                 skill = self.skill_instances[skill_name]
                 skill_info["execution_stats"] = skill.metadata.execution_stats
                 skill_info["status"] = skill.status.value
-                skill_info["last_updated"] = skill.metadata.last_updated.isoformat()
+                skill_info["last_updated"] = skill.metadata.last_updated_iso
 
             report["skills"][skill_name] = skill_info
 
         return report
 
-    async def refresh_registry(self):
-        """Refresh the registry by reloading configurations."""
+    async def refresh_registry(self, preload: bool = False):
+        """Refresh the registry by reloading configurations.
+
+        Skills are loaded lazily by execute_skill, so by default nothing is
+        imported here.
+
+        Args:
+            preload: Also load and activate every auto-load skill now, importing
+                their modules concurrently
+        """
+        # Write pending changes first so reloading does not discard them
+        await self.aclose()
         self._load_skill_configurations()
 
-        # Reload any skills that should be auto-loaded
-        for skill_name, config in self.skill_configurations.items():
-            if config["auto_load"] and config["enabled"]:
-                if not self.is_skill_loaded(skill_name):
-                    await self.load_skill(skill_name)
-                if not self.is_skill_active(skill_name):
-                    await self.activate_skill(skill_name)
+        if not preload:
+            return
+
+        auto_load = [
+            skill_name for skill_name, config in self.skill_configurations.items()
+            if config["auto_load"] and config["enabled"]
+        ]
+
+        # Overlap the cold imports; load_skill reports any that failed
+        module_paths = list(dict.fromkeys(
+            self.skill_configurations[skill_name]["module_path"] for skill_name in auto_load
+            if self.skill_configurations[skill_name]["module_path"] not in self.loaded_modules
+        ))
+        modules = await asyncio.gather(
+            *(asyncio.to_thread(importlib.import_module, path) for path in module_paths),
+            return_exceptions=True
+        )
+        for path, module in zip(module_paths, modules):
+            if not isinstance(module, BaseException):
+                self.loaded_modules[path] = module
+
+        # Load and activate, dependencies first
+        for skill_name in self._dependency_order(auto_load):
+            if not self.is_skill_loaded(skill_name):
+                await self.load_skill(skill_name)
+            if not self.is_skill_active(skill_name):
+                await self.activate_skill(skill_name)
 
     def get_skill_dependencies(self, skill_name: str) -> List[str]:
         """Get dependencies for a specific skill.
@@ -492,11 +760,7 @@ class SkillRegistry:
         Returns:
             List of dependent skill names
         """
-        dependents = []
-        for name, config in self.skill_configurations.items():
-            if skill_name in config.get("dependencies", []):
-                dependents.append(name)
-        return dependents
+        return list(self._dependents.get(skill_name, ()))
 
 
 # Example usage and testing
@@ -552,5 +816,8 @@ if __name__ == "__main__":
         )
         print(f"Configuration update success: {update_success}")
 
+        # Write the pending configuration change before the loop closes
+        await registry.aclose()
+
     # Run the test
     asyncio.run(test_skill_registry())
\ No newline at end of file
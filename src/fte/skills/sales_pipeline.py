@@ -2,11 +2,133 @@
 Sales Pipeline Skill - Lead management and nurturing
 """
 import asyncio
+from collections import Counter
 from datetime import datetime, timedelta
+from itertools import count
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 from .framework import BaseSkill, SkillMetadata, SkillStatus
 from ..vault_manager import VaultManager
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Upper bound on leads processed concurrently by one pipeline run
+_MAX_CONCURRENT_LEADS = 32
+
+# Nurturing action logs written to the vault per file
+_NURTURING_LOG_BATCH_SIZE = 64
+
+# Pipeline stages and nurturing sequences are read-only and shared by every skill instance.
+_PIPELINE_STAGES = MappingProxyType({
+    "prospect": MappingProxyType({
+        "name": "Prospect",
+        "description": "Initial contact with potential customer",
+        "qualification_criteria": ("contact_info_valid", "initial_interest"),
+        "next_stage": "qualified",
+        "typical_duration_days": 7
+    }),
+    "qualified": MappingProxyType({
+        "name": "Qualified",
+        "description": "Lead meets basic qualification criteria",
+        "qualification_criteria": ("budget_confirmed", "authority_identified", "need_established", "timeline_defined"),
+        "next_stage": "proposal",
+        "typical_duration_days": 14
+    }),
+    "proposal": MappingProxyType({
+        "name": "Proposal",
+        "description": "Solution proposal sent to qualified lead",
+        "qualification_criteria": ("proposal_accepted",),
+        "next_stage": "negotiation",
+        "typical_duration_days": 21
+    }),
+    "negotiation": MappingProxyType({
+        "name": "Negotiation",
+        "description": "Contract terms and pricing negotiations",
+        "qualification_criteria": ("terms_agreed",),
+        "next_stage": "closed_won",
+        "typical_duration_days": 14
+    }),
+    "closed_won": MappingProxyType({
+        "name": "Closed Won",
+        "description": "Deal successfully closed",
+        "qualification_criteria": ("contract_signed", "payment_received"),
+        "next_stage": None,
+        "typical_duration_days": 0
+    }),
+    "closed_lost": MappingProxyType({
+        "name": "Closed Lost",
+        "description": "Deal lost to competitor or abandoned",
+        "qualification_criteria": ("deal_lost", "alternative_chosen"),
+        "next_stage": None,
+        "typical_duration_days": 0
+    })
+})
+
+_NURTURING_SEQUENCES = MappingProxyType({
+    "cold_to_warm": (
+        MappingProxyType({"day": 1, "action": "send_introduction_email", "content": "Nice to meet you, here's what we do..."}),
+        MappingProxyType({"day": 3, "action": "share_valuable_content", "content": "Here's an article you might find interesting..."}),
+        MappingProxyType({"day": 7, "action": "ask_open_question", "content": "What challenges are you facing in your business?"}),
+        MappingProxyType({"day": 14, "action": "offer_consultation", "content": "Would you be interested in a free consultation?"}),
+        MappingProxyType({"day": 21, "action": "present_solution", "content": "Based on our conversation, here's how we can help..."})
+    ),
+    "warm_to_hot": (
+        MappingProxyType({"day": 1, "action": "confirm_interest", "content": "Great talking with you yesterday, let's move forward..."}),
+        MappingProxyType({"day": 2, "action": "send_case_study", "content": "Here's how we helped a similar company..."}),
+        MappingProxyType({"day": 5, "action": "schedule_demo", "content": "Shall we schedule a product demonstration?"}),
+        MappingProxyType({"day": 7, "action": "address_concerns", "content": "Do you have any concerns about our solution?"}),
+        MappingProxyType({"day": 10, "action": "send_proposal", "content": "Here's the proposal we discussed..."})
+    ),
+    "hot_to_closed": (
+        MappingProxyType({"day": 1, "action": "follow_up_proposal", "content": "Following up on the proposal I sent..."}),
+        MappingProxyType({"day": 3, "action": "address_objections", "content": "I heard your concerns, here's how we can address them..."}),
+        MappingProxyType({"day": 5, "action": "negotiate_terms", "content": "Let me know if these terms work for you..."}),
+        MappingProxyType({"day": 7, "action": "final_push", "content": "Last chance to secure this offer..."}),
+        MappingProxyType({"day": 10, "action": "contract_prep", "content": "Preparing the contract for signature..."})
+    )
+})
+
+
+class _NurturingLogBatcher:
+    """Collects nurturing action logs and writes them to the vault in batches.
+
+    Each batch becomes one vault file with one action log per line. A batch is
+    written when it fills up or when flush() is called.
+    """
+
+    _sequence = count()
+
+    def __init__(self, vault_manager: VaultManager, max_batch_size: int = _NURTURING_LOG_BATCH_SIZE):
+        self.vault_manager = vault_manager
+        self.max_batch_size = max_batch_size
+        self._pending: List[Dict[str, Any]] = []
+
+    async def add(self, action_log: Dict[str, Any]):
+        """Queue an action log, writing the batch if it is full."""
+        self._pending.append(action_log)
+        if len(self._pending) >= self.max_batch_size:
+            await self.flush()
+
+    async def flush(self):
+        """Write all queued action logs to the vault."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        await asyncio.to_thread(self._write_batch, batch)
+
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        """Save one batch of action logs as a single vault file."""
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.vault_manager.save_content(
+            f"nurturing_log_batch_{stamp}_{next(self._sequence)}",
+            "\n".join(str(action_log) for action_log in batch),
+            category="sales_pipeline"
+        )
+
 
 class SalesPipelineSkill(BaseSkill):
     """Manages lead management and nurturing in the sales pipeline."""
@@ -25,79 +147,30 @@ class SalesPipelineSkill(BaseSkill):
         # Define pipeline stages and progression rules
         self.pipeline_stages = self._define_pipeline_stages()
         self.nurturing_sequences = self._define_nurturing_sequences()
+        self._stage_paths = self._build_stage_paths()
+
+        # Created on first use so it writes through the current vault manager
+        self._log_batcher: Optional[_NurturingLogBatcher] = None
 
     def _define_pipeline_stages(self) -> Dict[str, Any]:
         """Define the sales pipeline stages."""
-        return {
-            "prospect": {
-                "name": "Prospect",
-                "description": "Initial contact with potential customer",
-                "qualification_criteria": ["contact_info_valid", "initial_interest"],
-                "next_stage": "qualified",
-                "typical_duration_days": 7
-            },
-            "qualified": {
-                "name": "Qualified",
-                "description": "Lead meets basic qualification criteria",
-                "qualification_criteria": ["budget_confirmed", "authority_identified", "need_established", "timeline_defined"],
-                "next_stage": "proposal",
-                "typical_duration_days": 14
-            },
-            "proposal": {
-                "name": "Proposal",
-                "description": "Solution proposal sent to qualified lead",
-                "qualification_criteria": ["proposal_accepted"],
-                "next_stage": "negotiation",
-                "typical_duration_days": 21
-            },
-            "negotiation": {
-                "name": "Negotiation",
-                "description": "Contract terms and pricing negotiations",
-                "qualification_criteria": ["terms_agreed"],
-                "next_stage": "closed_won",
-                "typical_duration_days": 14
-            },
-            "closed_won": {
-                "name": "Closed Won",
-                "description": "Deal successfully closed",
-                "qualification_criteria": ["contract_signed", "payment_received"],
-                "next_stage": None,
-                "typical_duration_days": 0
-            },
-            "closed_lost": {
-                "name": "Closed Lost",
-                "description": "Deal lost to competitor or abandoned",
-                "qualification_criteria": ["deal_lost", "alternative_chosen"],
-                "next_stage": None,
-                "typical_duration_days": 0
-            }
-        }
+        return _PIPELINE_STAGES
 
     def _define_nurturing_sequences(self) -> Dict[str, List[Dict[str, Any]]]:
         """Define nurturing sequences for different lead types."""
-        return {
-            "cold_to_warm": [
-                {"day": 1, "action": "send_introduction_email", "content": "Nice to meet you, here's what we do..."},
-                {"day": 3, "action": "share_valuable_content", "content": "Here's an article you might find interesting..."},
-                {"day": 7, "action": "ask_open_question", "content": "What challenges are you facing in your business?"},
-                {"day": 14, "action": "offer_consultation", "content": "Would you be interested in a free consultation?"},
-                {"day": 21, "action": "present_solution", "content": "Based on our conversation, here's how we can help..."}
-            ],
-            "warm_to_hot": [
-                {"day": 1, "action": "confirm_interest", "content": "Great talking with you yesterday, let's move forward..."},
-                {"day": 2, "action": "send_case_study", "content": "Here's how we helped a similar company..."},
-                {"day": 5, "action": "schedule_demo", "content": "Shall we schedule a product demonstration?"},
-                {"day": 7, "action": "address_concerns", "content": "Do you have any concerns about our solution?"},
-                {"day": 10, "action": "send_proposal", "content": "Here's the proposal we discussed..."}
-            ],
-            "hot_to_closed": [
-                {"day": 1, "action": "follow_up_proposal", "content": "Following up on the proposal I sent..."},
-                {"day": 3, "action": "address_objections", "content": "I heard your concerns, here's how we can address them..."},
-                {"day": 5, "action": "negotiate_terms", "content": "Let me know if these terms work for you..."},
-                {"day": 7, "action": "final_push", "content": "Last chance to secure this offer..."},
-                {"day": 10, "action": "contract_prep", "content": "Preparing the contract for signature..."}
-            ]
-        }
+        return _NURTURING_SEQUENCES
+
+    def _build_stage_paths(self) -> Dict[str, tuple]:
+        """Map each stage to the stages that follow it, in pipeline order."""
+        paths = {}
+        for stage in self.pipeline_stages:
+            path = []
+            next_stage = self.pipeline_stages[stage]["next_stage"]
+            while next_stage and next_stage != stage and next_stage not in path:
+                path.append(next_stage)
+                next_stage = self.pipeline_stages[next_stage]["next_stage"]
+            paths[stage] = tuple(path)
+        return paths
 
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute sales pipeline operation.
@@ -148,12 +221,21 @@ class SalesPipelineSkill(BaseSkill):
             "avg_sales_cycle_days": 0
         }
 
-        # Process each lead
-        for lead in leads:
-            processed_lead = await self._process_lead(
-                lead, target_stage, actions
-            )
+        # Process leads concurrently; each lead is independent
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_LEADS)
 
+        async def process(lead: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._process_lead(lead, target_stage, actions)
+
+        processed_leads = await asyncio.gather(*(process(lead) for lead in leads))
+
+        # Write out this run's remaining nurturing logs
+        if self._log_batcher is not None:
+            await self._log_batcher.flush()
+
+        # Tally results in lead order after all processing is done
+        for processed_lead in processed_leads:
             # Determine what happened to the lead
             if processed_lead["previous_stage"] != processed_lead["current_stage"]:
                 moved_leads.append(processed_lead)
@@ -178,13 +260,21 @@ class SalesPipelineSkill(BaseSkill):
             stage = lead.get("stage", "prospect")
             stage_counts[stage] = stage_counts.get(stage, 0) + 1
 
-        for stage, count in stage_counts.items():
-            if count > 0:
-                # Calculate conversion from this stage to closed_won
-                converted_from_stage = len([lead for lead in leads if
-                                           lead.get("stage_history", []).count(stage) > 0 and
-                                           lead.get("current_stage") == "closed_won"])
-                conversion_metrics["stage_conversion_rates"][stage] = converted_from_stage / count
+        # A stage's rate is the number of input leads already marked closed_won
+        # whose stage_history names that stage, over the number of leads
+        # currently in it. Only plain stage-name entries count; the
+        # {"stage": ...} records _process_lead appends are not matched.
+        # Each won lead's history is walked once.
+        won_by_stage = Counter()
+        for lead in leads:
+            if lead.get("current_stage") == "closed_won":
+                won_by_stage.update({
+                    entry for entry in lead.get("stage_history", []) if isinstance(entry, str)
+                })
+
+        for stage, stage_total in stage_counts.items():
+            # Conversion from this stage to closed_won
+            conversion_metrics["stage_conversion_rates"][stage] = won_by_stage[stage] / stage_total
 
         return {
             "moved_leads": moved_leads,
@@ -205,7 +295,7 @@ class SalesPipelineSkill(BaseSkill):
         original_stage = lead.get("stage", "prospect")
 
         # Determine if lead can advance to target stage
-        updated_lead = await self._advance_lead_if_qualified(lead, target_stage)
+        updated_lead = self._advance_lead_if_qualified(lead, target_stage)
 
         # Apply nurturing sequence if needed
         if updated_lead["stage"] != target_stage:
@@ -215,15 +305,16 @@ class SalesPipelineSkill(BaseSkill):
         if "stage_history" not in updated_lead:
             updated_lead["stage_history"] = []
 
+        now_iso = datetime.now().isoformat()
         if updated_lead["stage"] != original_stage:
             updated_lead["stage_history"].append({
                 "stage": updated_lead["stage"],
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso,
                 "reason": f"Advanced toward {target_stage}"
             })
 
         # Update last contact date
-        updated_lead["last_contacted"] = datetime.now().isoformat()
+        updated_lead["last_contacted"] = now_iso
 
         return {
             **updated_lead,
@@ -233,30 +324,26 @@ class SalesPipelineSkill(BaseSkill):
             "nurturing_applied": updated_lead.get("nurturing_sequence_applied", False)
         }
 
-    async def _advance_lead_if_qualified(
+    def _advance_lead_if_qualified(
         self,
         lead: Dict[str, Any],
         target_stage: str
     ) -> Dict[str, Any]:
         """Advance lead to next stage if qualified."""
         current_stage = lead.get("stage", "prospect")
+        if current_stage == target_stage:
+            return lead
 
-        # Check if we can advance to target stage
-        while current_stage != target_stage:
-            next_stage = self.pipeline_stages[current_stage]["next_stage"]
-
-            if not next_stage:
-                break  # End of pipeline
-
+        # Walk the precomputed path toward the target stage (or the end of the pipeline)
+        for next_stage in self._stage_paths[current_stage]:
             # Check qualification criteria for next stage
-            qualified = self._check_qualification_criteria(lead, next_stage)
-
-            if qualified:
-                lead["stage"] = next_stage
-                current_stage = next_stage
-            else:
+            if not self._check_qualification_criteria(lead, next_stage):
                 break  # Can't advance further
 
+            lead["stage"] = next_stage
+            if next_stage == target_stage:
+                break
+
         return lead
 
     async def _apply_nurturing_sequence(
@@ -308,12 +395,10 @@ class SalesPipelineSkill(BaseSkill):
             "timestamp": datetime.now().isoformat()
         }
 
-        # Save action log to vault
-        self.vault_manager.save_content(
-            f"nurturing_log_{action_log['lead_id']}_{int(datetime.now().timestamp())}",
-            str(action_log),
-            category="sales_pipeline"
-        )
+        # Queue the action log for a batched vault write
+        if self._log_batcher is None:
+            self._log_batcher = _NurturingLogBatcher(self.vault_manager)
+        await self._log_batcher.add(action_log)
 
         # Update lead with nurturing activity
         if "nurturing_activities" not in lead:
@@ -328,6 +413,15 @@ class SalesPipelineSkill(BaseSkill):
 
         return True
 
+    async def close(self):
+        """Write any queued nurturing logs to the vault."""
+        if self._log_batcher is not None:
+            await self._log_batcher.flush()
+
+    async def _on_deactivate(self):
+        """Flush queued nurturing logs when the skill is deactivated."""
+        await self.close()
+
     def _check_qualification_criteria(
         self,
         lead: Dict[str, Any],
@@ -446,6 +540,42 @@ class SalesPipelineSkill(BaseSkill):
         time_factor = 1.0 / max(engagement_score, 0.1)  # Lower engagement = longer time
         predicted_days = int(typical_duration * time_factor)
 
+        return self._lead_prediction(lead, current_stage, probability, predicted_days)
+
+    def predict_lead_outcomes_bulk(self, leads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Predict the likely outcome for many leads at once.
+
+        Gives the same results as predict_lead_outcome for each lead, scoring
+        all leads with vectorized NumPy arithmetic when NumPy is installed.
+        """
+        if not NUMPY_AVAILABLE:
+            return [self.predict_lead_outcome(lead) for lead in leads]
+
+        stages = [lead.get("stage", "prospect") for lead in leads]
+        engagement = np.array([lead.get("engagement_score", 0.5) for lead in leads], dtype=np.float64)
+        interactions = np.array([len(lead.get("nurturing_activities", [])) for lead in leads], dtype=np.float64)
+        durations = np.array(
+            [self.pipeline_stages.get(stage, {}).get("typical_duration_days", 7) for stage in stages],
+            dtype=np.float64
+        )
+
+        # Same formulas and operation order as predict_lead_outcome
+        probabilities = np.minimum(0.3 + (engagement * 0.4) + (np.minimum(interactions / 10, 1.0) * 0.3), 1.0)
+        predicted_days = (durations * (1.0 / np.maximum(engagement, 0.1))).astype(np.int64)
+
+        return [
+            self._lead_prediction(lead, stage, probability, days)
+            for lead, stage, probability, days in zip(leads, stages, probabilities.tolist(), predicted_days.tolist())
+        ]
+
+    def _lead_prediction(
+        self,
+        lead: Dict[str, Any],
+        current_stage: str,
+        probability: float,
+        predicted_days: int
+    ) -> Dict[str, Any]:
+        """Assemble the prediction result for a lead."""
         return {
             "current_stage": current_stage,
             "probability_to_next_stage": probability,
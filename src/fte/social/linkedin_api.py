@@ -13,6 +13,10 @@ except ImportError:
     LINKEDIN_API_AVAILABLE = False
 
 
+class LinkedInAuthError(RuntimeError):
+    """Raised when a LinkedIn session cannot be established."""
+
+
 class LinkedInAPI:
     """LinkedIn API client for posting and retrieving data."""
 
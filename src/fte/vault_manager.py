@@ -1,9 +1,11 @@
 """Vault Manager - Read, write, and organize markdown files in the vault."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import re
 import shutil
+import threading
 
 
 class VaultManager:
@@ -43,6 +45,20 @@ class VaultManager:
             path = self.vault_path / path
         return path.read_text(encoding="utf-8")
 
+    def exists(self, file_path: str | Path) -> bool:
+        """Check whether a file exists in the vault.
+
+        Args:
+            file_path: Path to the file (absolute or relative to vault)
+
+        Returns:
+            True if the file exists
+        """
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = self.vault_path / path
+        return path.is_file()
+
     def write_file(self, file_path: str | Path, content: str) -> Path:
         """Write content to a markdown file.
 
@@ -194,26 +210,38 @@ class VaultManager:
         Returns:
             List of dicts with file info and content preview
         """
-        items = []
-        for file_path in self.list_files("Inbox"):
-            content = file_path.read_text(encoding="utf-8")
-            # Get first 200 chars as preview (skip frontmatter)
-            preview = content
-            if content.startswith("---"):
-                end_fm = content.find("---", 3)
-                if end_fm != -1:
-                    preview = content[end_fm + 3 :].strip()
-            preview = preview[:200] + "..." if len(preview) > 200 else preview
-
-            items.append(
-                {
-                    "path": file_path,
-                    "name": file_path.stem,
-                    "preview": preview,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime),
-                }
-            )
-        return items
+        files = self.list_files("Inbox")
+        if len(files) <= 1:
+            return [self._read_inbox_item(file_path) for file_path in files]
+
+        # File reads are I/O-bound, so overlap them across a small thread pool
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            return list(executor.map(self._read_inbox_item, files))
+
+    def _read_inbox_item(self, file_path: Path) -> dict:
+        """Read a single Inbox file into an item dict with a content preview.
+
+        Args:
+            file_path: Path to the Inbox file
+
+        Returns:
+            Dict with file info and content preview
+        """
+        content = file_path.read_text(encoding="utf-8")
+        # Get first 200 chars as preview (skip frontmatter)
+        preview = content
+        if content.startswith("---"):
+            end_fm = content.find("---", 3)
+            if end_fm != -1:
+                preview = content[end_fm + 3 :].strip()
+        preview = preview[:200] + "..." if len(preview) > 200 else preview
+
+        return {
+            "path": file_path,
+            "name": file_path.stem,
+            "preview": preview,
+            "modified": datetime.fromtimestamp(file_path.stat().st_mtime),
+        }
 
     def save_content(self, *args, **kwargs) -> Path:
         """Save content to a markdown file, supporting flexible parameter ordering.
@@ -336,3 +364,26 @@ class VaultManager:
         }
 
         return category_folder_map.get(category, "Inbox")  # Default to Inbox if category not mapped
+
+
+_shared_managers: dict[Path | None, VaultManager] = {}
+_shared_managers_lock = threading.Lock()
+
+
+def get_vault_manager(vault_path: str | Path | None = None) -> VaultManager:
+    """Get the shared vault manager for a vault path.
+
+    Args:
+        vault_path: Path to the vault directory. Defaults to ./vault
+
+    Returns:
+        VaultManager instance shared by all callers using the same path
+    """
+    key = Path(vault_path) if vault_path is not None else None
+    manager = _shared_managers.get(key)
+    if manager is None:
+        with _shared_managers_lock:
+            manager = _shared_managers.get(key)
+            if manager is None:
+                manager = _shared_managers[key] = VaultManager(vault_path)
+    return manager
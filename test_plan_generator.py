@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Test script to verify Plan Generator markdown output."""
+
+import tempfile
+from pathlib import Path
+
+from src.fte.skills.plan_generator import PlanGenerator
+
+
+def test_plan_details_show_first_budget_line():
+    """The Plan Details bullet holds only the first line of the budget."""
+    with tempfile.TemporaryDirectory() as vault_path:
+        generator = PlanGenerator(vault_path=vault_path)
+        plan = generator.generate_plan(
+            "Launch a new software product for small business customers within 3 months"
+        )
+        budget_lines = plan["estimated_budget"].split("\n")
+        assert len(budget_lines) > 1
+
+        output_path = generator.save_plan_as_markdown(plan, Path(vault_path) / "Plan.md")
+        markdown = output_path.read_text(encoding="utf-8")
+
+    details = markdown.split("## Plan Details\n\n", 1)[1].split("\n## ", 1)[0]
+    assert details.endswith(f"- **Estimated Budget:** {budget_lines[0]}\n")
+    assert not any(line in details for line in budget_lines[1:])
+
+
+def test_objective_analysis_is_cached():
+    """Analyzing the same objective twice returns the cached analysis."""
+    with tempfile.TemporaryDirectory() as vault_path:
+        done = Path(vault_path) / "Done"
+        done.mkdir()
+        (done / "launch_review.md").write_text("Lesson learned from the product launch: start early.")
+        (done / "unrelated.md").write_text("Quarterly office supplies order.")
+
+        generator = PlanGenerator(vault_path=vault_path)
+        analysis = generator.analyze_business_objective("Launch new product for customers")
+        assert generator.analyze_business_objective("Launch new product for customers") is analysis
+
+    history = analysis["historical_context"]
+    assert history["similar_past_projects"] == 1
+    assert history["relevant_lessons_learned"] == ["Lesson learned from the product launch: start early."]
+
+
+if __name__ == "__main__":
+    tests = [
+        test_plan_details_show_first_budget_line,
+        test_objective_analysis_is_cached,
+    ]
+    for test in tests:
+        test()
+        print(f"[OK] {test.__name__}")
+    print(f"\nAll {len(tests)} plan generator tests passed")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Test script to verify Sales Pipeline metrics and logging."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from src.fte.skills.sales_pipeline import SalesPipelineSkill
+
+
+def test_stage_conversion_rates():
+    """Stage conversion rates count plain stage names in won leads' histories."""
+    leads = [
+        {"id": "a", "stage": "proposal", "current_stage": "closed_won",
+         "stage_history": ["qualified", {"stage": "proposal"}]},
+        {"id": "b", "stage": "proposal", "current_stage": "prospect",
+         "stage_history": ["proposal"]},
+        {"id": "c", "stage": "negotiation", "current_stage": "closed_won",
+         "stage_history": ["qualified", "proposal", "negotiation"]},
+    ]
+
+    with tempfile.TemporaryDirectory() as vault_path:
+        skill = SalesPipelineSkill(vault_path=vault_path)
+        result = asyncio.run(skill.execute({
+            "leads": leads,
+            "target_stage": "proposal",
+            "actions": ["no_such_action"],
+        }))
+
+    rates = result["pipeline_results"]["conversion_metrics"]["stage_conversion_rates"]
+    # "proposal": only lead c's plain entry counts, over the two proposal leads
+    assert rates == {"proposal": 0.5, "negotiation": 1.0}
+
+
+def _nurturing_log_files(vault_path):
+    return sorted(Path(vault_path).rglob("nurturing_log_batch_*"))
+
+
+def test_nurturing_logs_are_batched():
+    """Nurturing action logs are written in shared files of up to 64 entries."""
+    leads = [{"id": f"lead_{i:02d}", "stage": "prospect"} for i in range(30)]
+
+    with tempfile.TemporaryDirectory() as vault_path:
+        skill = SalesPipelineSkill(vault_path=vault_path)
+        asyncio.run(skill.execute({"leads": leads, "target_stage": "qualified"}))
+
+        contents = [path.read_text(encoding="utf-8") for path in _nurturing_log_files(vault_path)]
+
+    # 30 leads x 5 cold_to_warm actions = 150 logs -> batches of 64, 64, 22
+    assert len(contents) == 3
+    assert sum(content.count("'lead_id': ") for content in contents) == 150
+    assert all("".join(contents).count(f"'lead_id': '{lead['id']}'") == 5 for lead in leads)
+
+
+def test_deactivate_flushes_pending_nurturing_logs():
+    """Logs queued outside a pipeline run are written when the skill is deactivated."""
+    with tempfile.TemporaryDirectory() as vault_path:
+        skill = SalesPipelineSkill(vault_path=vault_path)
+
+        async def nurture_and_deactivate():
+            step = skill.nurturing_sequences["cold_to_warm"][0]
+            await skill._execute_nurturing_action({"id": "lead_01"}, step, [])
+            assert not _nurturing_log_files(vault_path)
+            await skill.deactivate()
+
+        asyncio.run(nurture_and_deactivate())
+        contents = [path.read_text(encoding="utf-8") for path in _nurturing_log_files(vault_path)]
+
+    assert len(contents) == 1
+    assert "'lead_id': 'lead_01'" in contents[0]
+
+
+if __name__ == "__main__":
+    tests = [
+        test_stage_conversion_rates,
+        test_nurturing_logs_are_batched,
+        test_deactivate_flushes_pending_nurturing_logs,
+    ]
+    for test in tests:
+        test()
+        print(f"[OK] {test.__name__}")
+    print(f"\nAll {len(tests)} sales pipeline tests passed")
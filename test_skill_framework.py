@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Test script to verify skill framework dependency layering and lifecycle."""
+
+import asyncio
+import tempfile
+
+from src.fte.skills.framework import BaseSkill, SkillFramework, SkillRegistry
+
+# Deactivation order observed by RecordingSkill
+deactivated = []
+
+
+class RecordingSkill(BaseSkill):
+    """Skill that records when it is deactivated."""
+
+    async def execute(self, params):
+        return {"status": "success"}
+
+    async def _on_deactivate(self):
+        deactivated.append(self.name)
+
+
+def _skill_config(name, dependencies=()):
+    return {
+        "name": name,
+        "module_path": __name__,
+        "class_name": "RecordingSkill",
+        "dependencies": list(dependencies),
+    }
+
+
+def test_load_layers_follow_dependencies():
+    """Skills come after their registered dependencies; unknown ones are ignored."""
+    registry = SkillRegistry()
+    for name, dependencies in (
+        ("base", []),
+        ("reports", ["base"]),
+        ("alerts", ["base"]),
+        ("digest", ["reports", "alerts"]),
+        ("export", ["not_registered"]),
+    ):
+        registry.register_skill(None, _skill_config(name, dependencies))
+
+    assert registry.calculate_load_layers() == [["base", "export"], ["reports", "alerts"], ["digest"]]
+
+
+def test_load_layers_reject_cycles():
+    """A dependency cycle raises ValueError naming the skills involved."""
+    registry = SkillRegistry()
+    registry.register_skill(None, _skill_config("first", ["second"]))
+    registry.register_skill(None, _skill_config("second", ["first"]))
+    registry.register_skill(None, _skill_config("independent"))
+
+    try:
+        registry.calculate_load_layers()
+    except ValueError as e:
+        assert "first" in str(e) and "second" in str(e)
+        assert "independent" not in str(e)
+    else:
+        raise AssertionError("Expected a circular dependency error")
+
+
+def test_reload_config_unloads_dependents_first():
+    """reload_config unloads skills in reverse dependency order, then reloads them."""
+    with tempfile.TemporaryDirectory() as vault_path:
+        skills = [
+            _skill_config("base"),
+            _skill_config("reports", ["base"]),
+            _skill_config("digest", ["reports"]),
+        ]
+
+        async def run():
+            framework = SkillFramework(vault_path)
+
+            async def load_config():
+                return {"default_skills": skills}
+
+            framework.config_loader.load_config = load_config
+            await framework.initialize()
+            assert sorted(framework.registry.list_skills()) == ["base", "digest", "reports"]
+
+            deactivated.clear()
+            await framework.reload_config()
+            assert deactivated == ["digest", "reports", "base"]
+            assert sorted(framework.registry.list_skills()) == ["base", "digest", "reports"]
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    tests = [
+        test_load_layers_follow_dependencies,
+        test_load_layers_reject_cycles,
+        test_reload_config_unloads_dependents_first,
+    ]
+    for test in tests:
+        test()
+        print(f"[OK] {test.__name__}")
+    print(f"\nAll {len(tests)} skill framework tests passed")
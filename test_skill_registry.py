@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Test script to verify skill registry configuration persistence."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from src.fte.skills.registry import SkillRegistry
+
+
+def test_registration_inside_event_loop_is_saved():
+    """A skill registered inside asyncio.run is on disk once the loop exits."""
+    with tempfile.TemporaryDirectory() as vault_path:
+        async def register():
+            registry = SkillRegistry(vault_path)
+            registry.register_skill_type("custom_skill", "custom.module", "CustomSkill")
+
+        asyncio.run(register())
+
+        reloaded = SkillRegistry(vault_path)
+        assert "custom_skill" in reloaded.list_registered_skills()
+        assert reloaded.get_skill_configuration("custom_skill")["class_name"] == "CustomSkill"
+
+
+def test_aclose_writes_pending_changes():
+    """aclose() writes debounced changes before returning."""
+    with tempfile.TemporaryDirectory() as vault_path:
+        async def register_and_close():
+            registry = SkillRegistry(vault_path)
+            registry.register_skill_type("custom_skill", "custom.module", "CustomSkill")
+            registry.update_skill_configuration("custom_skill", enabled=False)
+            await registry.aclose()
+            # Read back while the loop is still running
+            return SkillRegistry(vault_path).get_skill_configuration("custom_skill")
+
+        saved = asyncio.run(register_and_close())
+        assert saved is not None
+        assert saved["enabled"] is False
+
+
+def test_dependent_skills_follow_configuration_order():
+    """get_dependent_skills lists dependents in configuration order."""
+    with tempfile.TemporaryDirectory() as vault_path:
+        registry = SkillRegistry(vault_path)
+        for name in ("report", "alerts", "digest", "export"):
+            registry.register_skill_type(name, "custom.module", "CustomSkill")
+        registry.register_skill_type("base", "custom.module", "CustomSkill")
+        assert registry.get_dependent_skills("base") == []
+
+        # Dependencies added out of configuration order
+        for name in ("export", "alerts", "report"):
+            registry.update_skill_configuration(name, dependencies=["base"])
+        assert registry.get_dependent_skills("base") == ["report", "alerts", "export"]
+
+        registry.update_skill_configuration("alerts", dependencies=[])
+        registry.register_skill_type("late", "custom.module", "CustomSkill", dependencies=["base"])
+        registry.update_skill_configuration("digest", dependencies=["base"])
+        assert registry.get_dependent_skills("base") == ["report", "digest", "export", "late"]
+
+        # Reloading from disk gives the same order
+        assert SkillRegistry(vault_path).get_dependent_skills("base") == ["report", "digest", "export", "late"]
+
+
+def test_corrupt_configuration_falls_back_to_defaults():
+    """An unreadable configuration file is set aside and the defaults are used."""
+    with tempfile.TemporaryDirectory() as vault_path:
+        config_path = Path(vault_path) / "Done" / "skill_registry_config"
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        config_path.write_text("{not json")
+
+        registry = SkillRegistry(vault_path)
+        assert "business_intelligence" in registry.list_registered_skills()
+        assert not config_path.exists()
+        assert list(config_path.parent.glob("skill_registry_config.corrupt-*"))
+
+
+def test_corrupt_configuration_survives_failed_rename():
+    """The defaults are still used when the corrupt file cannot be renamed."""
+    with tempfile.TemporaryDirectory() as vault_path:
+        config_path = Path(vault_path) / "Done" / "skill_registry_config"
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        config_path.write_text("{not json")
+
+        with mock.patch.object(Path, "rename", side_effect=PermissionError("read-only vault")):
+            registry = SkillRegistry(vault_path)
+        assert "business_intelligence" in registry.list_registered_skills()
+
+
+def test_status_report_tracks_skill_side_changes():
+    """The status report reflects a skill activated through its own methods."""
+    with tempfile.TemporaryDirectory() as vault_path:
+        async def run():
+            registry = SkillRegistry(vault_path)
+            registry.register_skill_type(
+                "framework_bi", "src.fte.skills.framework", "BusinessIntelligenceSkill"
+            )
+            skill = await registry.load_skill("framework_bi")
+            assert registry.get_skill_status_report()["skills"]["framework_bi"]["status"] == "loaded"
+
+            await skill.activate()
+            assert registry.get_skill_status_report()["skills"]["framework_bi"]["status"] == "active"
+            await registry.aclose()
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    tests = [
+        test_registration_inside_event_loop_is_saved,
+        test_aclose_writes_pending_changes,
+        test_dependent_skills_follow_configuration_order,
+        test_corrupt_configuration_falls_back_to_defaults,
+        test_corrupt_configuration_survives_failed_rename,
+        test_status_report_tracks_skill_side_changes,
+    ]
+    for test in tests:
+        test()
+        print(f"[OK] {test.__name__}")
+    print(f"\nAll {len(tests)} skill registry tests passed")